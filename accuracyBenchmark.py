@@ -0,0 +1,286 @@
+import csv
+import math
+import time
+import tracemalloc
+import numpy as np
+import panelGeometry
+import panelMethods
+import outOfCore
+import viscousPanelMethod
+
+# Accuracy Versus Cost Benchmark
+#
+# Every method and solver mode is run across panel counts against the references included in the repo:
+# the analytic cylinder pressure coefficient, the NACA 0012 experimental pressure coefficients at zero
+# angle of attack and the NACA 0012 and NACA 2412 lift curves. Each configuration records the RMS and
+# maximum error, the best wall time of the repeats and the peak traced memory, measured in a separate run
+# because tracing slows the pure Python parts of the solvers. The Pareto front of each case holds the
+# configurations that no other configuration beats on both error and wall time.
+
+# Method and solver mode pairs. Direct modes assemble and solve each angle of attack from scratch.
+configurations = [
+    ("source", "direct"),
+    ("vortex", "direct"),
+    ("sourceVortex", "direct"),
+    ("sourceVortex", "factorized"),
+    ("sourceVortex", "outOfCore"),
+    ("sourceVortex", "viscous"),
+]
+
+fieldNames = [
+    "case",
+    "method",
+    "mode",
+    "panels",
+    "rmsError",
+    "maxError",
+    "seconds",
+    "peakBytes",
+    "pareto",
+]
+
+
+def createCirclePoints(divisions: int) -> list:
+    """
+    Creates the clockwise points of a unit cylinder ending at its rightmost point, so that the first and last panels
+    meet there as at a trailing edge and neither is vertical.
+    """
+    thetas = [-2 * math.pi * ((index + 1) % divisions) / divisions for index in range(divisions)]
+    return panelGeometry.createPointsFromArrays(
+        [math.cos(theta) for theta in thetas], [math.sin(theta) for theta in thetas]
+    )
+
+
+def createCases(
+    clFileName0012: str = "NACA_0012_cl_a.txt",
+    clFileName2412: str = "NACA-2412_Book-fig4-10.txt",
+    experimentalFileName: str = "NACA_0012_experimental.txt",
+    maxAlphaDeg: float = 12,
+) -> list:
+    """
+    Creates the benchmark cases. Each is a dictionary with a name, a function creating the points for a panel count,
+    the angles of attack (radians), the reference and the error kind ("cylinder", "cp" or "cl"). Lift curve points
+    beyond maxAlphaDeg, where the measured lift stalls, are left out.
+    """
+    cases = [
+        {
+            "name": "Cylinder cp",
+            "createPoints": createCirclePoints,
+            "alphas": [0.0],
+            "reference": None,
+            "kind": "cylinder",
+        }
+    ]
+    xs, cps = panelGeometry.importTuples(experimentalFileName, " ")
+    cases.append(
+        {
+            "name": "NACA 0012 cp",
+            "createPoints": lambda panels: panelGeometry.createNacaPoints(0, 0, 0.12, panels // 2),
+            "alphas": [0.0],
+            "reference": (np.array(xs), np.array(cps)),
+            "kind": "cp",
+        }
+    )
+    for name, fileName, camber in (
+        ("NACA 0012 cl", clFileName0012, (0, 0)),
+        ("NACA 2412 cl", clFileName2412, (0.02, 0.4)),
+    ):
+        alphaDegs, cls = panelGeometry.importTuples(fileName, ",")
+        keep = [index for index, alphaDeg in enumerate(alphaDegs) if abs(alphaDeg) <= maxAlphaDeg]
+        cases.append(
+            {
+                "name": name,
+                "createPoints": lambda panels, camber=camber: panelGeometry.createNacaPoints(
+                    camber[0], camber[1], 0.12, panels // 2
+                ),
+                "alphas": [alphaDegs[index] * math.pi / 180 for index in keep],
+                "reference": np.array([cls[index] for index in keep]),
+                "kind": "cl",
+            }
+        )
+    return cases
+
+
+def solveConfiguration(
+    method: str,
+    mode: str,
+    points: list,
+    alphas: list,
+    reynoldsNumber: float = 3e6,
+    memoryLimit: int = 2 ** 26,
+) -> list:
+    """
+    Solves the body at each angle of attack (radians) with the method and solver mode at unit freestream velocity.
+    Returns a list of (cps, cl) in the order of the angles.
+    """
+    if mode == "direct":
+        functions = {
+            "source": panelMethods.findSourcePanelCoefficients,
+            "vortex": panelMethods.findVortexPanelCoefficients,
+            "sourceVortex": panelMethods.findSourceVortexPanelCoefficients,
+        }
+        results = []
+        for alpha in alphas:
+            panels = panelGeometry.createPanelsFromPoints(points, alpha)
+            cps, cl = functions[method](panels, 1, alpha)[:2]
+            results.append((cps, cl))
+        return results
+    if method != "sourceVortex":
+        raise Exception(str.format("The {} mode requires the sourceVortex method.", mode))
+    if mode == "factorized":
+        system = panelMethods.SourceVortexSystem(points)
+        return [(cps, cl) for cps, cl, cd, cm in system.findCoefficients(1, alphas)]
+    if mode == "outOfCore":
+        with outOfCore.OutOfCoreSourceVortexSystem(points, memoryLimit=memoryLimit) as system:
+            return [(cps, cl) for cps, cl, cd, cm in system.findCoefficients(1, alphas)]
+    if mode == "viscous":
+        solver = viscousPanelMethod.ViscousSourceVortexSolver(points, reynoldsNumber)
+        order = np.argsort(alphas)
+        polar = solver.findPolar([alphas[index] for index in order])
+        results = [None] * len(alphas)
+        for index, (cps, cl, cd, cm) in zip(order, polar):
+            results[index] = (cps, cl)
+        return results
+    raise Exception(str.format("Unknown solver mode {}.", mode))
+
+
+def findErrors(case: dict, panels: list, results: list) -> np.ndarray:
+    """
+    Finds the error of each compared value against the case reference.
+    """
+    if case["kind"] == "cylinder":
+        theta = np.array([math.atan2(panel.controlPoint.y, panel.controlPoint.x) for panel in panels])
+        return np.array(results[0][0]) - (1 - 4 * np.sin(theta) ** 2)
+    if case["kind"] == "cp":
+        # The body is symmetric at zero angle of attack, so the upper surface is compared
+        xs, cps = case["reference"]
+        xc = np.array([panel.controlPoint.x for panel in panels])
+        yc = np.array([panel.controlPoint.y for panel in panels])
+        upper = yc > 0
+        order = np.argsort(xc[upper])
+        computed = np.interp(xs, xc[upper][order], np.array(results[0][0])[upper][order])
+        return computed - cps
+    return np.array([cl for cps, cl in results]) - case["reference"]
+
+
+def runConfiguration(
+    case: dict,
+    method: str,
+    mode: str,
+    panelCount: int,
+    repeats: int = 3,
+    reynoldsNumber: float = 3e6,
+    memoryLimit: int = 2 ** 26,
+) -> dict:
+    """
+    Runs one configuration of a case, timing the best of the repeats and tracing the peak memory in a separate run.
+    The time includes creating the panels and assembling and solving every angle of attack of the case.
+    """
+    points = case["createPoints"](panelCount)
+    arguments = (method, mode, points, case["alphas"], reynoldsNumber, memoryLimit)
+    seconds = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        results = solveConfiguration(*arguments)
+        seconds = min(seconds, time.perf_counter() - start)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    solveConfiguration(*arguments)
+    peakBytes = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+    panels = panelGeometry.createPanelsFromPoints(points)
+    errors = findErrors(case, panels, results)
+    return {
+        "case": case["name"],
+        "method": method,
+        "mode": mode,
+        "panels": len(panels),
+        "rmsError": float(np.sqrt(np.mean(errors ** 2))),
+        "maxError": float(np.max(np.abs(errors))),
+        "seconds": seconds,
+        "peakBytes": int(peakBytes),
+        "pareto": False,
+    }
+
+
+def runBenchmark(
+    cases: list,
+    panelCounts: list,
+    configurations: list = configurations,
+    repeats: int = 3,
+    reynoldsNumber: float = 3e6,
+    memoryLimit: int = 2 ** 26,
+    log=print,
+) -> list:
+    """
+    Runs every configuration of every case at each panel count and marks the Pareto front of each case.
+    The cylinder has no viscous reference and its boundary layer separates, so the viscous mode skips it.
+    """
+    results = []
+    for case in cases:
+        caseResults = []
+        for method, mode in configurations:
+            if mode == "viscous" and case["kind"] == "cylinder":
+                continue
+            for panelCount in panelCounts:
+                result = runConfiguration(
+                    case, method, mode, panelCount, repeats, reynoldsNumber, memoryLimit
+                )
+                caseResults.append(result)
+                if log:
+                    log(
+                        str.format(
+                            "{:<14} {:<13} {:<11} {:>5d}   rms {:.3e}   {:.4f} s   {:.1f} MB",
+                            result["case"],
+                            method,
+                            mode,
+                            result["panels"],
+                            result["rmsError"],
+                            result["seconds"],
+                            result["peakBytes"] / 2 ** 20,
+                        )
+                    )
+        for result in findParetoFront(caseResults):
+            result["pareto"] = True
+        results.extend(caseResults)
+    return results
+
+
+def findParetoFront(
+    results: list, error: str = "rmsError", cost: str = "seconds", tolerance: float = 1e-6
+) -> list:
+    """
+    Returns the results that no other result beats on both the error and the cost, ordered by increasing cost.
+    Errors within a relative tolerance of each other are treated as equal, so equivalent solver modes are not all kept.
+    """
+    front = []
+    best = float("inf")
+    for result in sorted(results, key=lambda item: (item[cost], item[error])):
+        if result[error] < best * (1 - tolerance):
+            front.append(result)
+            best = result[error]
+    return front
+
+
+def findCheapest(results: list, target: float, error: str = "rmsError", cost: str = "seconds") -> dict:
+    """
+    Returns the cheapest result whose error meets the target, or None if no result does.
+    """
+    candidates = [result for result in results if result[error] <= target]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda item: item[cost])
+
+
+def writeResults(fileName: str, results: list):
+    """
+    Writes the results to a CSV file.
+    """
+    with open(fileName, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldNames)
+        writer.writeheader()
+        writer.writerows(results)
@@ -0,0 +1,287 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import panelGeometry
+import panelMethods
+import symmetry
+from geometryStore import GeometryStore
+from coefficientCache import CoefficientCache, hashPanels
+
+# Local Source/Vortex Panel Method Analysis Service
+#
+# POST /analyze with a JSON body holding the geometry and the angles of attack in degrees:
+#   {"points": [[x, y], ...], "alphas": [0, 5]}
+#   {"file": "NACA-2412_Geom.txt", "seperator": " ", "alphas": [0, 5]}
+#   {"store": "airfoils.geom", "name": "NACA-2412_Geom", "alphas": [0, 5]}
+# and the reply holds one {"alpha", "cl", "cd", "cm", "cps"} entry per alpha. The coefficients do not
+# depend on the freestream velocity, so none is needed.
+# GET /metrics returns latency, queue depth and coalescing statistics.
+#
+# Requests for the same geometry that arrive within the coalescing window share one
+# assembled and factorized system and are answered by a single multi-alpha solve.
+# Answered angles are memoized at unit velocity, so repeated queries at any velocity skip the solver.
+# They are the flow solved at each alpha from panels built at zero, which is not what
+# CoefficientCache.findCoefficients("sourceVortex", ...) returns for those panels, so they are stored under
+# their own method tag and never share an entry with direct callers.
+cacheMethod = "sourceVortexSystem"
+
+
+class GeometryBatch:
+    """
+    The angles of attack requested for one geometry that will be solved together.
+    """
+
+    def __init__(this, points: list):
+        this.points = points
+        this.alphas = []
+        this.requests = 0
+        this.future = asyncio.get_running_loop().create_future()
+
+    def add(this, alphas: list) -> slice:
+        """
+        Adds the angles (radians) of one request and returns the columns its results will occupy.
+        """
+        start = len(this.alphas)
+        this.alphas.extend(alphas)
+        this.requests += 1
+        return slice(start, len(this.alphas))
+
+
+class AnalysisService:
+    """
+    Coalesces concurrent analysis requests by geometry and solves them on a worker pool.
+    """
+
+    def __init__(
+        this,
+        dataDirectory: str = None,
+        workers: int = None,
+        coalesceWindow: float = 0.005,
+        maxSystems: int = 32,
+        latencyWindow: int = 1000,
+        cache: CoefficientCache = None,
+    ):
+        this.dataDirectory = os.path.realpath(dataDirectory or os.getcwd())
+        this.executor = ThreadPoolExecutor(max_workers=workers)
+        this.coalesceWindow = coalesceWindow
+        this.maxSystems = maxSystems
+        this.systems = OrderedDict()
+        this.batches = {}
+        this.assemblies = {}
+        this.cache = cache or CoefficientCache()
+        this.stores = {}
+        this.latencies = deque(maxlen=latencyWindow)
+        this.queueDepth = 0
+        this.requestCount = 0
+        this.errorCount = 0
+        this.solveCount = 0
+        this.assemblyCount = 0
+
+    def loadPoints(this, request: dict) -> list:
+        """
+        Creates the points of a request from inline coordinates, a geometry file or a body in a packed geometry store.
+        Files and stores must be in the data directory. Stores are opened once and kept mapped.
+        """
+        if "points" in request:
+            xs, ys = zip(*request["points"])
+            return panelGeometry.createPointsFromArrays(list(xs), list(ys))
+        if "file" in request:
+            path = this.findDataPath(request["file"])
+            return panelGeometry.importPoints(path, request.get("seperator", " "))
+        if "store" in request:
+            path = this.findDataPath(request["store"])
+            store = this.stores.get(path)
+            if store is None:
+                store = this.stores.setdefault(path, GeometryStore(path))
+            return store.getPoints(request["name"])
+        raise Exception("A request must contain points, a file or a store.")
+
+    def loadGeometry(this, request: dict) -> tuple:
+        """
+        Creates the points of a request and hashes their panels. This is pure Python work that grows with the panel
+        count, so it runs on the worker pool.
+        """
+        points = this.loadPoints(request)
+        return points, hashPanels(panelGeometry.createPanelsFromPoints(points))
+
+    def findDataPath(this, fileName: str) -> str:
+        path = os.path.realpath(os.path.join(this.dataDirectory, fileName))
+        if os.path.commonpath([path, this.dataDirectory]) != this.dataDirectory:
+            raise Exception("Geometry files must be inside the data directory.")
+        return path
+
+    async def getSystem(this, key: str, points: list) -> panelMethods.SourceVortexSystem:
+        """
+        Returns the factorized system of a geometry, split into half-size systems if it is symmetric.
+        Uncached systems are assembled on the worker pool, and batches that need a system which is already being assembled wait for it instead.
+        """
+        system = this.systems.get(key)
+        if system is not None:
+            this.systems.move_to_end(key)
+            return system
+        assembly = this.assemblies.get(key)
+        if assembly is None:
+            loop = asyncio.get_running_loop()
+            assembly = loop.run_in_executor(
+                this.executor, symmetry.createSourceVortexSystem, points
+            )
+            this.assemblies[key] = assembly
+            this.assemblyCount += 1
+        try:
+            system = await assembly
+        finally:
+            this.assemblies.pop(key, None)
+        this.systems[key] = system
+        while len(this.systems) > this.maxSystems:
+            this.systems.popitem(last=False)
+        return system
+
+    async def dispatch(this, key: str, batch: GeometryBatch):
+        """
+        Waits for the coalescing window to close and then solves every angle of the batch together on the worker pool.
+        """
+        await asyncio.sleep(this.coalesceWindow)
+        del this.batches[key]
+        loop = asyncio.get_running_loop()
+        try:
+            system = await this.getSystem(key, batch.points)
+            results = await loop.run_in_executor(
+                this.executor, system.findCoefficients, 1, np.array(batch.alphas)
+            )
+        except Exception as exception:
+            batch.future.set_exception(exception)
+            return
+        this.solveCount += 1
+        for alpha, result in zip(batch.alphas, results):
+            this.cache.store(key, cacheMethod, alpha, result)
+        batch.future.set_result(results)
+
+    async def analyzeRequest(this, request: dict) -> list:
+        """
+        Answers one analysis request from the cache, joining any open batch for the same geometry
+        with the angles that are not cached. The coefficients do not depend on the freestream velocity.
+        """
+        start = time.perf_counter()
+        this.requestCount += 1
+        this.queueDepth += 1
+        try:
+            alphas = [float(alpha) for alpha in request["alphas"]]
+            loop = asyncio.get_running_loop()
+            points, key = await loop.run_in_executor(this.executor, this.loadGeometry, request)
+            radians = np.radians(alphas)
+            results = [this.cache.lookup(key, cacheMethod, alpha) for alpha in radians]
+            missing = [index for index, result in enumerate(results) if result is None]
+            if missing:
+                batch = this.batches.get(key)
+                if batch is None:
+                    batch = GeometryBatch(points)
+                    this.batches[key] = batch
+                    asyncio.ensure_future(this.dispatch(key, batch))
+                columns = batch.add([radians[index] for index in missing])
+                solved = (await batch.future)[columns]
+                for index, result in zip(missing, solved):
+                    results[index] = result
+        except Exception:
+            this.errorCount += 1
+            raise
+        finally:
+            this.queueDepth -= 1
+            this.latencies.append(time.perf_counter() - start)
+        return [
+            {"alpha": alpha, "cl": float(cl), "cd": float(cd), "cm": float(cm), "cps": cps}
+            for alpha, (cps, cl, cd, cm) in zip(alphas, results)
+        ]
+
+    def getMetrics(this) -> dict:
+        """
+        Returns the latency (seconds), queue depth and coalescing statistics of the service.
+        """
+        latencies = np.array(this.latencies)
+        metrics = {
+            "requests": this.requestCount,
+            "errors": this.errorCount,
+            "queueDepth": this.queueDepth,
+            "openBatches": len(this.batches),
+            "solves": this.solveCount,
+            "assemblies": this.assemblyCount,
+            "cachedSystems": len(this.systems),
+            "cache": this.cache.getStats(),
+        }
+        if len(latencies):
+            metrics["latency"] = {
+                "mean": float(np.mean(latencies)),
+                "p50": float(np.percentile(latencies, 50)),
+                "p95": float(np.percentile(latencies, 95)),
+                "p99": float(np.percentile(latencies, 99)),
+                "max": float(np.max(latencies)),
+            }
+        return metrics
+
+    async def handleConnection(this, reader, writer):
+        """
+        Serves the HTTP/1.1 requests of one connection.
+        """
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine:
+                    break
+                method, target, _ = requestLine.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, reply = await this.route(method, target, body)
+                payload = json.dumps(reply).encode()
+                writer.write(
+                    str.format(
+                        "HTTP/1.1 {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\n\r\n",
+                        status,
+                        len(payload),
+                    ).encode()
+                    + payload
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(this, method: str, target: str, body: bytes) -> tuple:
+        """
+        Dispatches a request to its endpoint and returns the status line and JSON reply.
+        """
+        if method == "GET" and target == "/metrics":
+            return "200 OK", this.getMetrics()
+        if method == "POST" and target == "/analyze":
+            try:
+                results = await this.analyzeRequest(json.loads(body))
+            except Exception as exception:
+                return "400 Bad Request", {"error": str(exception)}
+            return "200 OK", {"results": results}
+        return "404 Not Found", {"error": "Unknown endpoint."}
+
+    async def serve(this, port: int = 8765):
+        """
+        Serves requests on localhost until cancelled.
+        """
+        server = await asyncio.start_server(this.handleConnection, "127.0.0.1", port)
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    print(str.format("Serving panel method analyses on http://127.0.0.1:{}", port))
+    asyncio.run(AnalysisService().serve(port))
@@ -0,0 +1,97 @@
+import accuracyBenchmark
+import matplotlib.pyplot as plt
+
+# Accuracy Versus Cost of the Panel Methods
+
+# Inputs
+panelCounts = [25, 50, 100, 200, 400]
+repeats = 3
+reynoldsNumber = 3e6  # Used by the viscous mode.
+memoryLimit = 2 ** 26  # Tile memory of the out-of-core mode.
+maxAlphaDeg = 12  # Lift curve points past this angle are stalled and left out.
+targets = {  # The RMS error each case must meet in production.
+    "Cylinder cp": 1e-2,
+    "NACA 0012 cp": 5e-2,
+    "NACA 0012 cl": 5e-2,
+    "NACA 2412 cl": 5e-2,
+}
+outputFileName = "accuracy_benchmark.csv"
+plotFileName = "accuracy_benchmark.png"
+
+# Run every configuration and export the results with their Pareto fronts.
+cases = accuracyBenchmark.createCases(maxAlphaDeg=maxAlphaDeg)
+results = accuracyBenchmark.runBenchmark(
+    cases, panelCounts, repeats=repeats, reynoldsNumber=reynoldsNumber, memoryLimit=memoryLimit
+)
+accuracyBenchmark.writeResults(outputFileName, results)
+
+# Report the Pareto front and the cheapest configuration meeting the target of each case.
+for case in cases:
+    caseResults = [result for result in results if result["case"] == case["name"]]
+    print()
+    print(str.format("{} Pareto front", case["name"]))
+    print("method         mode          panels    rms error     time (s)   memory (MB)")
+    for result in accuracyBenchmark.findParetoFront(caseResults):
+        print(
+            str.format(
+                "{:<14} {:<11} {:>8d}   {:>10.3e}   {:>10.4f}   {:>11.1f}",
+                result["method"],
+                result["mode"],
+                result["panels"],
+                result["rmsError"],
+                result["seconds"],
+                result["peakBytes"] / 2 ** 20,
+            )
+        )
+    target = targets.get(case["name"])
+    if target is not None:
+        cheapest = accuracyBenchmark.findCheapest(caseResults, target)
+        if cheapest is None:
+            print(str.format("No configuration meets an RMS error of {:.1e}", target))
+        else:
+            print(
+                str.format(
+                    "Cheapest within {:.1e}: {} {} with {} panels",
+                    target,
+                    cheapest["method"],
+                    cheapest["mode"],
+                    cheapest["panels"],
+                )
+            )
+
+# Plot the error against the wall time of each case with its Pareto front.
+for index, case in enumerate(cases):
+    caseResults = [result for result in results if result["case"] == case["name"]]
+    plt.subplot(2, 2, index + 1)
+    for method, mode in accuracyBenchmark.configurations:
+        points = [
+            result
+            for result in caseResults
+            if result["method"] == method and result["mode"] == mode
+        ]
+        if points:
+            plt.loglog(
+                [result["seconds"] for result in points],
+                [result["rmsError"] for result in points],
+                "o-",
+                label=str.format("{} {}", method, mode),
+            )
+    front = accuracyBenchmark.findParetoFront(caseResults)
+    plt.step(
+        [result["seconds"] for result in front],
+        [result["rmsError"] for result in front],
+        "--",
+        where="post",
+        c="k",
+        label="Pareto front",
+    )
+    if case["name"] in targets:
+        plt.axhline(targets[case["name"]], c="r", lw=0.8)
+    plt.xlabel("Wall time (s)")
+    plt.ylabel("RMS error")
+    plt.title(case["name"])
+plt.legend(loc="upper right", fontsize="small")
+plt.tight_layout()
+plt.savefig(plotFileName)
+
+plt.show()
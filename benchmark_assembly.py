@@ -0,0 +1,81 @@
+import time
+import numpy as np
+import panelGeometry
+import panelMethods
+
+# Thread Scaling of the Influence Matrix Assembly
+
+# Inputs
+divisions = 4000  # Number of panels on the benchmark cylinder.
+blockSize = 256  # Rows per assembly block.
+workerCounts = [1, 2, 4, 8, 16]
+repeats = 3
+checkTolerance = 1e-10  # Largest allowed difference from the quadrature check.
+
+
+def findQuadratureMatrices(panels: list, order: int = 200) -> tuple:
+    """
+    Integrates the I, J and L integrands along every other panel with Gauss-Legendre quadrature.
+    """
+    xc, yc, xs, ys, phi, s = panelMethods.getPanelArrays(panels)
+    t, w = np.polynomial.legendre.leggauss(order)
+    t = (t[None, :] + 1) / 2 * s[:, None]
+    w = w[None, :] * s[:, None] / 2
+    dx = xc[:, None, None] - (xs[None, :, None] + t[None] * np.cos(phi)[None, :, None])
+    dy = yc[:, None, None] - (ys[None, :, None] + t[None] * np.sin(phi)[None, :, None])
+    r2 = dx ** 2 + dy ** 2
+    cos_i = np.cos(phi)[:, None, None]
+    sin_i = np.sin(phi)[:, None, None]
+    matrices = []
+    for numerator in (-dx * sin_i + dy * cos_i, dx * cos_i + dy * sin_i, dx * sin_i - dy * cos_i):
+        matrix = np.sum(w[None] * numerator / r2, axis=-1)
+        np.fill_diagonal(matrix, 0)
+        matrices.append(matrix)
+    return tuple(matrices)
+
+
+# Check the assembly against quadrature on a square with three collinear panels per side and on a cylinder.
+square = [(1, -1), (-1, -1), (-1, 1), (1, 1), (1, -1)]
+squarePoints = [
+    panelGeometry.Point(
+        square[k // 3][0] + (square[k // 3 + 1][0] - square[k // 3][0]) * (k % 3 + 1) / 3,
+        square[k // 3][1] + (square[k // 3 + 1][1] - square[k // 3][1]) * (k % 3 + 1) / 3,
+    )
+    for k in range(12)
+]
+for name, checkPanels in (
+    ("square", panelGeometry.createPanelsFromPoints(squarePoints)),
+    ("cylinder", panelGeometry.createCirclePanels(1, 64)),
+):
+    error = max(
+        np.max(np.abs(assembled - quadrature))
+        for assembled, quadrature in zip(
+            panelMethods.findInfluenceMatrices(checkPanels, "IJL"), findQuadratureMatrices(checkPanels)
+        )
+    )
+    print(str.format("{} check: largest difference from quadrature {:.2e}", name, error))
+    if error > checkTolerance:
+        raise Exception("The assembled influence matrices do not match quadrature.")
+
+panels = panelGeometry.createCirclePanels(1, divisions)
+panels.reverse()
+
+# Time the assembly of the I, J and L matrices for each worker count, keeping the best of the repeats.
+times = []
+for workers in workerCounts:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        panelMethods.findInfluenceMatrices(panels, "IJL", workers, blockSize)
+        best = min(best, time.perf_counter() - start)
+    times.append(best)
+
+print(str.format("{} panels, block size {}", divisions, blockSize))
+print("workers      time (s)   speedup   efficiency")
+for workers, elapsed in zip(workerCounts, times):
+    speedup = times[0] / elapsed
+    print(
+        str.format(
+            "{:>7d}   {:>11.4f}   {:>7.2f}   {:>9.0%}", workers, elapsed, speedup, speedup / workers
+        )
+    )
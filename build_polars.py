@@ -0,0 +1,49 @@
+import math
+import os
+import numpy as np
+import panelGeometry
+import polarTables
+
+# Precompute a Polar Table for Fast Lookups
+
+# Inputs
+tableFileName = "polars.tbl"
+alphaMinDeg = -20
+alphaMaxDeg = 20
+alphaStepDeg = 0.25
+fileNames = ["NACA-2412_Geom.txt", "NACA_0012_b.txt"]  # The data files must be in the same folder as this file.
+seperator = " "  # The seperator ie comma, space etc.
+familyThicknesses = [0.06, 0.09, 0.12, 0.15, 0.18]  # NACA 4-digit family with the camber at 40% chord.
+familyCambers = [0.0, 0.02, 0.04]
+familyDivisions = 50
+
+# Convert alpha to radians
+count = int(round((alphaMaxDeg - alphaMinDeg) / alphaStepDeg)) + 1
+alphas = np.radians(np.linspace(alphaMinDeg, alphaMaxDeg, count))
+
+# Import the bodies and create the family
+names = []
+pointsList = []
+parameters = []
+for fileName in fileNames:
+    path = os.path.join(os.getcwd(), fileName)
+    names.append(os.path.splitext(fileName)[0])
+    pointsList.append(panelGeometry.importPoints(path, seperator))
+    parameters.append({})
+for camber in familyCambers:
+    for thickness in familyThicknesses:
+        names.append(
+            str.format("NACA {:.0f}4{:02.0f}", camber * 100, thickness * 100)
+        )
+        pointsList.append(
+            panelGeometry.createNacaPoints(camber, 0.4, thickness, familyDivisions)
+        )
+        parameters.append({"camber": camber, "thickness": thickness})
+
+polarTables.writePolarTable(tableFileName, names, pointsList, alphas, parameters)
+
+# Check a lookup
+table = polarTables.PolarTable(tableFileName)
+cl, cd, cm = table.lookupFamily(math.radians(4), thickness=0.12, camber=0.02)
+print(str.format("Wrote {} polars to {}", len(names), tableFileName))
+print(str.format("NACA 2412 at 4 degrees: cl = {:.4f}, cm = {:.4f}", cl, cm))
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+import panelMethods
+
+# Memoization of Panel Method Coefficients
+#
+# The panel strengths scale linearly with the freestream velocity, so the pressure, lift, drag and moment
+# coefficients do not depend on it. Results are computed and stored at unit velocity and keyed on the
+# geometry hash, the method and the angle of attack, so a query at any velocity hits the same entry. The
+# geometry hash includes the angles the panels were built at, as the solution uses the panels' own beta.
+
+methods = {
+    "source": panelMethods.findSourcePanelCoefficients,
+    "vortex": panelMethods.findVortexPanelCoefficients,
+    "sourceVortex": panelMethods.findSourceVortexPanelCoefficients,
+}
+
+
+def hashPanels(panels: list) -> str:
+    """
+    Hashes the start and end points and the beta of the panels, so panels of the same body built at different angles
+    of attack hash differently.
+    """
+    coordinates = np.array(
+        [
+            (panel.startPoint.x, panel.startPoint.y, panel.endPoint.x, panel.endPoint.y, panel.beta)
+            for panel in panels
+        ]
+    )
+    return hashlib.sha1(coordinates.tobytes()).hexdigest()
+
+
+class CoefficientCache:
+    """
+    A two tier cache of unit velocity coefficients: an in-memory LRU backed by an optional directory on disk.
+    """
+
+    def __init__(this, maxEntries: int = 4096, directory: str = None):
+        this.maxEntries = maxEntries
+        this.directory = directory
+        this.entries = OrderedDict()
+        this.memoryHits = 0
+        this.diskHits = 0
+        this.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def getKey(this, geometryKey: str, method: str, alpha: float) -> str:
+        """
+        Builds the cache key. Alpha is rounded so that degree to radian conversions that differ in the last bit still match.
+        """
+        return str.format("{}-{}-{!r}", geometryKey, method, round(float(alpha), 12))
+
+    def getPath(this, key: str) -> str:
+        return os.path.join(this.directory, hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+    def lookup(this, geometryKey: str, method: str, alpha: float):
+        """
+        Returns the unit velocity result for the key, or None when neither tier holds it.
+        """
+        key = this.getKey(geometryKey, method, alpha)
+        result = this.entries.get(key)
+        if result is not None:
+            this.entries.move_to_end(key)
+            this.memoryHits += 1
+            return result
+        if this.directory:
+            try:
+                with open(this.getPath(key), "r") as file:
+                    result = tuple(json.load(file))
+            except (OSError, ValueError):
+                result = None
+            if result is not None:
+                this.diskHits += 1
+                this.remember(key, result)
+                return result
+        this.misses += 1
+        return None
+
+    def store(this, geometryKey: str, method: str, alpha: float, result: tuple) -> tuple:
+        """
+        Stores a unit velocity result in memory and, if enabled, on disk. Returns the stored form of the result.
+        """
+        key = this.getKey(geometryKey, method, alpha)
+        result = tuple(
+            [float(value) for value in item] if isinstance(item, list) else float(item)
+            for item in result
+        )
+        this.remember(key, result)
+        if this.directory:
+            path = this.getPath(key)
+            temporaryPath = str.format("{}.{}.tmp", path, os.getpid())
+            with open(temporaryPath, "w") as file:
+                json.dump(result, file)
+            os.replace(temporaryPath, path)
+        return result
+
+    def remember(this, key: str, result: tuple):
+        this.entries[key] = result
+        this.entries.move_to_end(key)
+        while len(this.entries) > this.maxEntries:
+            this.entries.popitem(last=False)
+
+    def findCoefficients(
+        this, method: str, panels: list, freestreamVelocity: float, alpha: float
+    ) -> tuple:
+        """
+        Memoized equivalent of the panelMethods coefficient functions, where method is "source", "vortex" or "sourceVortex".
+        Returns the same tuple as the wrapped function. The accuracy term of the source and vortex methods scales with velocity.
+        """
+        geometryKey = hashPanels(panels)
+        result = this.lookup(geometryKey, method, alpha)
+        if result is None:
+            result = this.store(
+                geometryKey, method, alpha, methods[method](panels, 1, alpha)
+            )
+        result = tuple(list(item) if isinstance(item, list) else item for item in result)
+        if method != "sourceVortex":
+            result = result[:-1] + (result[-1] * freestreamVelocity,)
+        return result
+
+    def getStats(this) -> dict:
+        """
+        Returns the hit counts and hit rate of the cache.
+        """
+        lookups = this.memoryHits + this.diskHits + this.misses
+        return {
+            "memoryHits": this.memoryHits,
+            "diskHits": this.diskHits,
+            "misses": this.misses,
+            "hitRate": (this.memoryHits + this.diskHits) / lookups if lookups else 0.0,
+            "entries": len(this.entries),
+        }
+
+    def clear(this):
+        """
+        Empties the in-memory tier and resets the statistics. Files on disk are kept.
+        """
+        this.entries.clear()
+        this.memoryHits = 0
+        this.diskHits = 0
+        this.misses = 0
@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+import numpy as np
+import panelGeometry
+
+# Packed Geometry Store
+#
+# One file holds the coordinates of many bodies: a short JSON header with the names, the offset and
+# point count of each body and any metadata, followed by one aligned float64 array of (x, y) rows.
+# Points are stored clockwise, as returned by importPoints, so they can go straight to createPanelsFromPoints.
+#
+# Pack text files:      python geometryStore.py pack store.geom NACA-2412_Geom.txt NACA_0012_b.txt
+# Unpack to text files: python geometryStore.py unpack store.geom outputFolder
+
+magic = b"GEOMSTR1"
+alignment = 64
+
+
+def writeGeometryStore(
+    fileName: str, names: list, pointsList: list, metadata: list = None
+):
+    """
+    Writes the bodies to a packed geometry store. Each body is oriented clockwise before it is stored.
+    """
+    if len(set(names)) != len(names):
+        raise Exception("Body names must be unique.")
+    metadata = metadata or [{} for _ in names]
+    arrays = []
+    bodies = []
+    offset = 0
+    for name, points, bodyMetadata in zip(names, pointsList, metadata):
+        if not panelGeometry.checkIfPointsAreCW(points):
+            points = points[::-1]
+        arrays.append(np.array([[point.x, point.y] for point in points]))
+        bodies.append(
+            {"name": name, "offset": offset, "count": len(points), "metadata": bodyMetadata}
+        )
+        offset += len(points)
+    header = json.dumps({"bodies": bodies}).encode()
+    padding = -(len(magic) + 8 + len(header)) % alignment
+    temporaryName = str.format("{}.{}.tmp", fileName, os.getpid())
+    with open(temporaryName, "wb") as file:
+        file.write(magic)
+        file.write(np.uint64(len(header) + padding).tobytes())
+        file.write(header + b" " * padding)
+        for array in arrays:
+            file.write(array.astype("<f8").tobytes())
+    os.replace(temporaryName, fileName)
+
+
+def packGeometryFiles(fileName: str, sourceFileNames: list, seperator: str = " "):
+    """
+    Imports text geometry files and packs them into a store, named by their file names without extensions.
+    """
+    names = [os.path.splitext(os.path.basename(name))[0] for name in sourceFileNames]
+    pointsList = [panelGeometry.importPoints(name, seperator) for name in sourceFileNames]
+    metadata = [{"source": os.path.basename(name)} for name in sourceFileNames]
+    writeGeometryStore(fileName, names, pointsList, metadata)
+
+
+def exportGeometryFile(store, name: str, fileName: str, seperator: str = " "):
+    """
+    Writes one body of a store to a text geometry file. Coordinates are written with repr, so reading the file back
+    gives the stored values exactly.
+    """
+    with open(fileName, "w") as file:
+        for x, y in store.getCoordinates(name).tolist():
+            file.write(str.format("{!r}{}{!r}\n", x, seperator, y))
+
+
+class GeometryStore:
+    """
+    A read only, memory mapped geometry store. Coordinates are returned as views of the mapped file without copying or parsing.
+    """
+
+    def __init__(this, fileName: str):
+        with open(fileName, "rb") as file:
+            if file.read(len(magic)) != magic:
+                raise Exception("The file is not a geometry store.")
+            headerLength = int(np.frombuffer(file.read(8), dtype="<u8")[0])
+            header = json.loads(file.read(headerLength))
+        this.bodies = {body["name"]: body for body in header["bodies"]}
+        this.names = [body["name"] for body in header["bodies"]]
+        total = sum(body["count"] for body in header["bodies"])
+        this.coordinates = np.memmap(
+            fileName,
+            dtype="<f8",
+            mode="r",
+            offset=len(magic) + 8 + headerLength,
+            shape=(total, 2),
+        )
+
+    def getCoordinates(this, name: str) -> np.ndarray:
+        """
+        Returns a read only (count, 2) view of the clockwise x and y values of the named body.
+        """
+        body = this.bodies[name]
+        return this.coordinates[body["offset"] : body["offset"] + body["count"]]
+
+    def getPoints(this, name: str) -> list:
+        """
+        Returns the points of the named body, ready for createPanelsFromPoints.
+        """
+        return [panelGeometry.Point(x, y) for x, y in this.getCoordinates(name).tolist()]
+
+    def getMetadata(this, name: str) -> dict:
+        return this.bodies[name]["metadata"]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == "pack":
+        packGeometryFiles(sys.argv[2], sys.argv[3:])
+    elif len(sys.argv) == 4 and sys.argv[1] == "unpack":
+        store = GeometryStore(sys.argv[2])
+        os.makedirs(sys.argv[3], exist_ok=True)
+        for name in store.names:
+            exportGeometryFile(store, name, os.path.join(sys.argv[3], name + ".txt"))
+    else:
+        print("Usage: python geometryStore.py pack store.geom files... | unpack store.geom folder")
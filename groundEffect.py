@@ -0,0 +1,138 @@
+import math
+import numpy as np
+import panelGeometry as pg
+import panelMethods
+
+# Ground Effect by the Image Method
+#
+# The ground is a straight streamline parallel to the freestream, which is modelled by mirroring the body
+# about it: each image panel carries the source strength of its body panel and the image vortex strength is
+# the negative of the body's, so the unknowns are unchanged and the image is never solved for. The body is
+# kept in its own frame, where pitching the body turns the freestream and the ground by the pitch angle.
+# Its self influence is independent of the height and pitch and is assembled once, so each new height or
+# pitch only assembles the N x N block of image influence on the body and solves an N + 1 system, instead of
+# assembling and solving the 2N panel body and image problem.
+
+
+class GroundEffectSystem:
+    """
+    A source (vortex=False) or source/vortex panel system of a rigid body above a flat ground.
+    Heights are measured from the ground to the pivot, a point in body coordinates, and the pitch (radians, nose up)
+    is also the angle of attack as the freestream is parallel to the ground.
+    """
+
+    def __init__(
+        this,
+        points: list,
+        vortex: bool = True,
+        pivot: tuple = (0.25, 0.0),
+        workers: int = None,
+        blockSize: int = None,
+    ):
+        this.panels = pg.createPanelsFromPoints(points)
+        this.vortex = vortex
+        this.pivot = np.array(pivot, dtype=float)
+        this.workers = workers or panelMethods.assemblyWorkers
+        this.blockSize = blockSize or panelMethods.assemblyBlockSize
+        this.arrays = panelMethods.getPanelArrays(this.panels)
+        this.length = this.arrays[5]
+        this.phi = this.arrays[4]
+        this.xc = this.arrays[0]
+        this.delta = np.array([panel.delta for panel in this.panels])
+        xs, ys, phi, s = this.arrays[2:]
+        # The panel start points and the end of the last panel
+        end = [xs[-1] + s[-1] * np.cos(phi[-1]), ys[-1] + s[-1] * np.sin(phi[-1])]
+        this.points = np.concatenate((np.stack((xs, ys), axis=1), [end]))
+
+        # Self influence, assembled once
+        if vortex:
+            this.matrixI, this.matrixJ, this.matrixL = panelMethods.findInfluenceMatrices(
+                this.panels, "IJL", workers, blockSize
+            )
+            this.matrixSelf = panelMethods.findSourceVortexMatrix(
+                this.matrixI, this.matrixJ, this.matrixL
+            )
+            this.sumL = np.sum(this.matrixL, axis=1)
+        else:
+            this.matrixI, this.matrixJ = panelMethods.findInfluenceMatrices(
+                this.panels, "IJ", workers, blockSize
+            )
+            this.matrixSelf = this.matrixI.copy()
+            np.fill_diagonal(this.matrixSelf, math.pi)
+
+    def findImageArrays(this, height: float, pitch: float) -> tuple:
+        """
+        Finds the panel arrays of the image body, mirrored about the ground at the height and pitch, in body coordinates.
+        """
+        normal = np.array([-math.sin(pitch), math.cos(pitch)])
+        ground = this.pivot - height * normal
+        clearance = (this.points - ground) @ normal
+        if np.min(clearance) <= 0:
+            raise Exception("The body intersects the ground.")
+        images = this.points - 2 * clearance[:, None] * normal
+        starts = images[:-1]
+        ends = images[1:]
+        dx = ends[:, 0] - starts[:, 0]
+        dy = ends[:, 1] - starts[:, 1]
+        xc = (starts[:, 0] + ends[:, 0]) / 2
+        yc = (starts[:, 1] + ends[:, 1]) / 2
+        return xc, yc, starts[:, 0], starts[:, 1], np.arctan2(dy, dx), np.hypot(dx, dy)
+
+    def findImageInfluence(this, height: float, pitch: float) -> dict:
+        """
+        Assembles the influence of the image panels on the body control points in blocks of rows on the worker threads.
+        """
+        kinds = "IJL" if this.vortex else "IJ"
+        blocks = panelMethods.findInfluenceMatrices(
+            this.panels,
+            kinds,
+            this.workers,
+            this.blockSize,
+            columnArrays=this.findImageArrays(height, pitch),
+        )
+        return dict(zip(kinds, blocks))
+
+    def solve(this, height: float, pitch: float, freestreamVelocity: float = 1) -> tuple:
+        """
+        Finds the pressure coefficients and the lift, drag and moment coefficients at the height and pitch (radians).
+        """
+        n = len(this.panels)
+        image = this.findImageInfluence(height, pitch)
+        matrixA = this.matrixSelf.copy()
+        matrixA[:n, :n] += image["I"]
+        beta = this.delta - pitch
+        if this.vortex:
+            # The image vortex strength is the negative of the body's
+            matrixA[:n, n] += np.sum(image["J"], axis=1)
+            matrixA[n, :n] += image["J"][0] + image["J"][-1]
+            matrixA[n, n] += np.sum(image["L"][0]) + np.sum(image["L"][-1])
+            matrixB = panelMethods.findSourceVortexRightHandSide(beta, freestreamVelocity)
+        else:
+            matrixB = -freestreamVelocity * 2 * math.pi * np.cos(beta)
+        strengths = np.linalg.solve(matrixA, matrixB)
+        sourceVelocities = (this.matrixJ + image["J"]) @ strengths[:n]
+        if this.vortex:
+            v = panelMethods.findSourceVortexSurfaceVelocities(
+                sourceVelocities,
+                this.sumL - np.sum(image["L"], axis=1),
+                beta,
+                strengths[n],
+                freestreamVelocity,
+            )
+        else:
+            v = freestreamVelocity * np.sin(beta) + sourceVelocities / (2 * math.pi)
+        cps = 1 - (v / freestreamVelocity) ** 2
+        cl, cd, cm = panelMethods.integrateForceCoefficients(
+            this.length, this.phi, this.xc, beta, cps, pitch
+        )
+        return cps.tolist(), cl, cd, cm
+
+    def findSweep(this, heights, pitches, freestreamVelocity: float = 1) -> list:
+        """
+        Solves every combination of the heights and pitches (radians), returned as a list of rows, one per height,
+        of (cps, cl, cd, cm) in the order of the pitches.
+        """
+        return [
+            [this.solve(height, pitch, freestreamVelocity) for pitch in pitches]
+            for height in heights
+        ]
@@ -0,0 +1,48 @@
+import math
+import time
+import panelGeometry
+import groundEffect
+import matplotlib.pyplot as plt
+import os
+
+# Source/Vortex Panel Method of an Imported Body in Ground Effect
+
+# Inputs
+fileName = "NACA-2412_Geom.txt"  # The data file must be in the same folder as this file.
+seperator = " "  # The seperator ie comma, space etc.
+heights = [0.15, 0.2, 0.3, 0.4, 0.6, 0.8, 1.0, 1.5, 2.0, 3.0]  # Quarter chord heights above the ground.
+pitchDegs = [0, 4, 8]
+
+# Import the data from the specified file and create points.
+path = os.path.join(os.getcwd(), fileName)
+points = panelGeometry.importPoints(path, seperator)
+
+# Assemble the body once, then sweep the heights and pitches
+system = groundEffect.GroundEffectSystem(points)
+start = time.perf_counter()
+sweep = system.findSweep(heights, [pitchDeg * math.pi / 180 for pitchDeg in pitchDegs])
+print(
+    str.format(
+        "{} heights x {} pitches in {:.3f} s", len(heights), len(pitchDegs), time.perf_counter() - start
+    )
+)
+
+# Plot cl and cm against height
+for column, pitchDeg in enumerate(pitchDegs):
+    label = r"$\alpha = $" + str(pitchDeg) + u"\N{DEGREE SIGN}"
+    plt.subplot(1, 2, 1)
+    plt.plot(heights, [row[column][1] for row in sweep], "o-", label=label)
+    plt.subplot(1, 2, 2)
+    plt.plot(heights, [row[column][3] for row in sweep], "o-", label=label)
+
+plt.subplot(1, 2, 1)
+plt.xlabel("h/c")
+plt.ylabel("$c_l$")
+plt.legend(loc="upper right")
+plt.subplot(1, 2, 2)
+plt.xlabel("h/c")
+plt.ylabel("$c_m$")
+
+plt.suptitle(os.path.splitext(fileName)[0] + " in Ground Effect")
+
+plt.show()
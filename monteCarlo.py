@@ -0,0 +1,152 @@
+import math
+import numpy as np
+import panelMethods
+
+# Batched Monte Carlo Uncertainty Quantification
+#
+# Perturbed copies of a body are held as one stacked (samples, points, 2) array. Manufacturing tolerances
+# move each surface normal to the chord by a random sum of sine modes, sin(k pi x / c), which vanish at the
+# leading and trailing edges so the topology and trailing edge are kept, and the angle of attack is sampled
+# about its mean. All samples share a panel count, so chunks of them are assembled as (chunk, N, N) batches
+# of influence matrices and solved with batched linear algebra. The chunk size is set by memoryLimit and
+# chunks run concurrently on a thread pool. Sampling is seeded and done up front, so results do not depend
+# on the chunk size or worker count.
+
+
+def samplePerturbations(
+    points: list,
+    samples: int,
+    toleranceSigma: float = 0.001,
+    alphaMean: float = 0.0,
+    alphaSigma: float = 0.0,
+    modes: int = 4,
+    seed: int = 0,
+) -> tuple:
+    """
+    Samples perturbed copies of the clockwise points and angles of attack (radians). Each surface gets its own
+    normally distributed sine mode coefficients with a standard deviation of toleranceSigma, a fraction of the chord.
+    Returns the stacked (samples, points, 2) coordinates and the angle of attack of each sample.
+    """
+    generator = np.random.default_rng(seed)
+    nominal = np.array([[point.x, point.y] for point in points])
+    minX = np.min(nominal[:, 0])
+    chord = np.max(nominal[:, 0]) - minX
+    x = (nominal[:, 0] - minX) / chord
+    leadingEdge = int(np.argmin(nominal[:, 0]))
+    surface = (np.arange(len(points)) > leadingEdge).astype(int)
+    shapes = np.sin(np.pi * np.arange(1, modes + 1)[:, None] * x[None, :])
+    coefficients = generator.normal(0, toleranceSigma * chord, (samples, 2, modes))
+    # Pick each point's surface coefficients and sum the modes: (samples, points)
+    offsets = np.einsum("spm,mp->sp", coefficients[:, surface, :], shapes)
+    coordinates = np.repeat(nominal[None], samples, axis=0)
+    coordinates[:, :, 1] += offsets
+    alphas = alphaMean + generator.normal(0, 1, samples) * alphaSigma
+    return coordinates, alphas
+
+
+def getBatchPanelArrays(coordinates) -> tuple:
+    """
+    Gathers the panel arrays of a stack of bodies, (samples, points, 2), as in panelMethods.getPanelArrays with a
+    leading sample axis. As in createPanelsFromPoints, a vertical trailing edge panel is left out.
+    The panel angles are also returned.
+    """
+    starts = np.roll(coordinates, 1, axis=-2)
+    ends = coordinates
+    if np.all(starts[:, 0, 0] == ends[:, 0, 0]):
+        starts = starts[:, 1:]
+        ends = ends[:, 1:]
+    if np.all(starts[:, -1, 0] == ends[:, -1, 0]):
+        starts = starts[:, :-1]
+        ends = ends[:, :-1]
+    dx = ends[..., 0] - starts[..., 0]
+    dy = ends[..., 1] - starts[..., 1]
+    phi = np.arctan2(dy, dx) % (2 * math.pi)
+    delta = (phi + math.pi / 2) % (2 * math.pi)
+    arrays = (
+        (starts[..., 0] + ends[..., 0]) / 2,
+        (starts[..., 1] + ends[..., 1]) / 2,
+        starts[..., 0],
+        starts[..., 1],
+        phi,
+        np.sqrt(dx ** 2 + dy ** 2),
+    )
+    return arrays, delta
+
+
+def findBatchCoefficients(coordinates, alphas) -> tuple:
+    """
+    Solves a stack of bodies, (samples, points, 2), each at its own angle of attack (radians) with the source/vortex
+    panel method and returns arrays of the cl, cd and cm of each sample.
+    """
+    arrays, delta = getBatchPanelArrays(coordinates)
+    n = delta.shape[1]
+    blocks = panelMethods.findInfluenceBlock(arrays, 0, n, "IJL")
+    matrixA = panelMethods.findSourceVortexMatrix(blocks["I"], blocks["J"], blocks["L"])
+    alphas = np.asarray(alphas, dtype=float)
+    # The boundary condition helpers hold one column per sample after the panel axis
+    beta = (delta - alphas[:, None]).T
+    matrixB = panelMethods.findSourceVortexRightHandSide(beta, 1)
+    lambdasAndGamma = np.linalg.solve(matrixA, matrixB.T[..., None])[..., 0].T
+    sourceVelocities = np.einsum("sij,js->is", blocks["J"], lambdasAndGamma[:-1])
+    v = panelMethods.findSourceVortexSurfaceVelocities(
+        sourceVelocities, np.sum(blocks["L"], axis=-1).T, beta, lambdasAndGamma[-1], 1
+    )
+    cps = 1 - v ** 2
+    xc, _, _, _, phi, length = arrays
+    return panelMethods.integrateForceCoefficients(length.T, phi.T, xc.T, beta, cps, alphas)
+
+
+def summarize(values, percentiles: tuple = (5, 50, 95)) -> dict:
+    """
+    Returns the mean, standard deviation, extremes and percentiles of the samples.
+    """
+    values = np.asarray(values)
+    return {
+        "mean": float(np.mean(values)),
+        "std": float(np.std(values, ddof=1)) if len(values) > 1 else 0.0,
+        "min": float(np.min(values)),
+        "max": float(np.max(values)),
+        "percentiles": {
+            percentile: float(value)
+            for percentile, value in zip(percentiles, np.percentile(values, percentiles))
+        },
+    }
+
+
+def runMonteCarlo(
+    points: list,
+    samples: int,
+    toleranceSigma: float = 0.001,
+    alphaMean: float = 0.0,
+    alphaSigma: float = 0.0,
+    modes: int = 4,
+    seed: int = 0,
+    percentiles: tuple = (5, 50, 95),
+    memoryLimit: int = 2 ** 30,
+    workers: int = None,
+) -> dict:
+    """
+    Samples the perturbed bodies and angles of attack (radians) and solves them in memory bounded chunks.
+    Returns the samples ("coordinates", "alphas"), the cl, cd and cm of every sample and a summary of each coefficient.
+    """
+    coordinates, alphas = samplePerturbations(
+        points, samples, toleranceSigma, alphaMean, alphaSigma, modes, seed
+    )
+    workers = workers or panelMethods.assemblyWorkers
+    n = len(points) + 1
+    chunkSize = int(
+        max(1, min(samples, memoryLimit // (workers * n ** 2 * panelMethods.bytesPerElement)))
+    )
+    chunks = [(start, min(start + chunkSize, samples)) for start in range(0, samples, chunkSize)]
+    results = np.empty((3, samples))
+
+    def solve(chunk):
+        start, stop = chunk
+        results[:, start:stop] = findBatchCoefficients(coordinates[start:stop], alphas[start:stop])
+
+    panelMethods.mapConcurrently(solve, chunks, workers)
+    output = {"coordinates": coordinates, "alphas": alphas, "chunkSize": chunkSize}
+    for name, values in zip(("cl", "cd", "cm"), results):
+        output[name] = values
+        output[name + "Summary"] = summarize(values, percentiles)
+    return output
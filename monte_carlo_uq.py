@@ -0,0 +1,73 @@
+import math
+import time
+import panelGeometry
+import monteCarlo
+import matplotlib.pyplot as plt
+
+# Monte Carlo Uncertainty of a NACA 4-Digit Airfoil
+
+# Inputs
+maxCamber = 0.02
+camberPosition = 0.4
+thickness = 0.12
+divisions = 100  # Points per surface, giving 2 x divisions panels.
+samples = 10000
+toleranceSigma = 0.001  # Standard deviation of each surface mode, as a fraction of the chord.
+modes = 4  # Number of sine modes per surface.
+alphaMeanDeg = 4
+alphaSigmaDeg = 0.5
+seed = 0
+percentiles = (5, 50, 95)
+memoryLimit = 2 ** 30  # Bytes of temporaries across all chunks being solved.
+
+# Sample and solve the perturbed airfoils
+points = panelGeometry.createNacaPoints(maxCamber, camberPosition, thickness, divisions)
+start = time.perf_counter()
+results = monteCarlo.runMonteCarlo(
+    points,
+    samples,
+    toleranceSigma,
+    alphaMeanDeg * math.pi / 180,
+    alphaSigmaDeg * math.pi / 180,
+    modes,
+    seed,
+    percentiles,
+    memoryLimit,
+)
+elapsed = time.perf_counter() - start
+print(
+    str.format(
+        "{} samples of {} panels in {:.1f} s ({} samples per chunk)",
+        samples,
+        2 * divisions,
+        elapsed,
+        results["chunkSize"],
+    )
+)
+for name in ("cl", "cd", "cm"):
+    summary = results[name + "Summary"]
+    print(
+        str.format(
+            "{}: mean {:.5f}, std {:.5f}, {}",
+            name,
+            summary["mean"],
+            summary["std"],
+            ", ".join(
+                str.format("p{} {:.5f}", percentile, value)
+                for percentile, value in summary["percentiles"].items()
+            ),
+        )
+    )
+
+# Plot the cl and cm distributions
+for index, name in enumerate(("cl", "cm")):
+    plt.subplot(1, 2, index + 1)
+    plt.hist(results[name], bins=60, color="tab:blue")
+    for percentile, value in results[name + "Summary"]["percentiles"].items():
+        plt.axvline(value, c="k", ls="--", lw=0.8)
+    plt.xlabel("$c_" + name[1] + "$")
+    plt.ylabel("Samples")
+
+plt.suptitle(str.format("{} Samples", samples))
+
+plt.show()
@@ -0,0 +1,231 @@
+import math
+import os
+import tempfile
+import numpy as np
+import panelGeometry as pg
+import panelMethods
+
+# Out-of-Core Source/Vortex Panel Method
+#
+# The (N + 1) x (N + 1) source/vortex matrix is assembled in row tiles straight into a memory mapped file,
+# and the system is solved with restarted GMRES whose matrix-vector products stream the file tile by tile.
+# Only tiles, the panel arrays and the Krylov basis are held in memory, so the peak memory is set by
+# memoryLimit rather than the panel count. The right hand side at any angle of attack is a combination of
+# two fixed vectors, cos(alpha) b1 + sin(alpha) b2, so only those two systems are solved; every angle then
+# follows without touching the file again.
+
+
+def solveGmres(
+    matvec,
+    matrixB,
+    diagonal,
+    tolerance: float = 1e-10,
+    restart: int = 50,
+    maxIterations: int = 1000,
+) -> tuple:
+    """
+    Solves A X = B for each column of B with restarted, Jacobi preconditioned GMRES. The columns are iterated in
+    lockstep so that each matrix-vector product, matvec(V) = A V, serves every column at once.
+    Returns the solution and the number of matrix-vector products.
+    """
+    n, k = matrixB.shape
+    x = np.zeros((n, k))
+    norms = np.linalg.norm(matrixB, axis=0)
+    norms[norms == 0] = 1
+    products = 0
+    while products < maxIterations:
+        residual = matrixB - matvec(x)
+        products += 1
+        beta = np.linalg.norm(residual, axis=0)
+        if np.all(beta / norms < tolerance):
+            break
+        basis = np.zeros((restart + 1, n, k))
+        hessenberg = np.zeros((k, restart + 1, restart))
+        basis[0] = residual / np.where(beta > 0, beta, 1)
+        active = beta / norms >= tolerance
+        steps = 0
+        for j in range(restart):
+            w = matvec(basis[j] / diagonal[:, None])
+            products += 1
+            for i in range(j + 1):
+                h = np.sum(basis[i] * w, axis=0)
+                hessenberg[:, i, j] = h
+                w -= basis[i] * h
+            h = np.linalg.norm(w, axis=0)
+            hessenberg[:, j + 1, j] = h
+            basis[j + 1] = w / np.where(h > 1e-300, h, 1)
+            steps = j + 1
+            converged = True
+            for column in np.nonzero(active)[0]:
+                e1 = np.zeros(steps + 1)
+                e1[0] = beta[column]
+                y = np.linalg.lstsq(hessenberg[column, : steps + 1, :steps], e1, rcond=None)[0]
+                estimate = np.linalg.norm(e1 - hessenberg[column, : steps + 1, :steps] @ y)
+                converged = converged and estimate / norms[column] < tolerance
+            if converged or products >= maxIterations:
+                break
+        for column in np.nonzero(active)[0]:
+            e1 = np.zeros(steps + 1)
+            e1[0] = beta[column]
+            y = np.linalg.lstsq(hessenberg[column, : steps + 1, :steps], e1, rcond=None)[0]
+            x[:, column] += np.tensordot(y, basis[:steps, :, column], axes=1) / diagonal
+    return x, products
+
+
+class OutOfCoreSourceVortexSystem:
+    """
+    A source/vortex panel system of a rigid body whose matrix lives in a memory mapped file.
+    Peak memory is roughly memoryLimit plus the Krylov basis, (restart + 1) x (N + 1) x 2 doubles.
+    Without a fileName the matrix goes in a temporary file in the working directory, which is deleted by close.
+    Use as a context manager so that it is deleted on exit, including after an error.
+    """
+
+    def __init__(
+        this,
+        points: list,
+        fileName: str = None,
+        memoryLimit: int = 2 ** 30,
+        workers: int = None,
+    ):
+        this.panels = pg.createPanelsFromPoints(points)
+        this.arrays = panelMethods.getPanelArrays(this.panels)
+        n = len(this.panels)
+        this.workers = workers or panelMethods.assemblyWorkers
+        this.tileRows = int(
+            max(1, min(n, memoryLimit // (this.workers * n * panelMethods.bytesPerElement)))
+        )
+        this.temporary = fileName is None
+        if this.temporary:
+            handle, fileName = tempfile.mkstemp(suffix=".matrix", dir=os.getcwd())
+            os.close(handle)
+        this.fileName = fileName
+        this.matrixA = None
+        this.length = this.arrays[5]
+        this.phi = this.arrays[4]
+        this.xc = this.arrays[0]
+        this.delta = np.array([panel.delta for panel in this.panels])
+        this.sumL = np.empty(n)
+        this.solutions = None
+        try:
+            this.matrixA = np.memmap(fileName, dtype="<f8", mode="w+", shape=(n + 1, n + 1))
+            this.assemble()
+        except BaseException:
+            this.close()
+            raise
+
+    def getTiles(this) -> list:
+        n = len(this.panels)
+        return [(start, min(start + this.tileRows, n)) for start in range(0, n, this.tileRows)]
+
+    def forEachTile(this, function):
+        """
+        Calls function(rowStart, rowStop) for every tile of rows, on the worker threads.
+        """
+        return panelMethods.mapConcurrently(lambda tile: function(*tile), this.getTiles(), this.workers)
+
+    def assemble(this):
+        """
+        Streams the source/vortex matrix, including the Kutta condition row, into the mapped file tile by tile.
+        """
+        n = len(this.panels)
+
+        def fill(rowStart, rowStop):
+            blocks = panelMethods.findInfluenceBlock(this.arrays, rowStart, rowStop, "IJL")
+            rows = np.arange(rowStart, rowStop)
+            tile = blocks["I"]
+            tile[rows - rowStart, rows] = math.pi
+            this.matrixA[rowStart:rowStop, :n] = tile
+            this.matrixA[rowStart:rowStop, n] = -np.sum(blocks["J"], axis=1)
+            this.sumL[rowStart:rowStop] = np.sum(blocks["L"], axis=1)
+
+        this.forEachTile(fill)
+        first = panelMethods.findInfluenceBlock(this.arrays, 0, 1, "JL")
+        last = panelMethods.findInfluenceBlock(this.arrays, n - 1, n, "JL")
+        # Apply the Kutta condition
+        this.matrixA[n, :n] = first["J"][0] + last["J"][0]
+        this.matrixA[n, n] = -(np.sum(first["L"]) + np.sum(last["L"])) + 2 * math.pi
+        this.matrixA.flush()
+
+    def matvec(this, vectors) -> np.ndarray:
+        """
+        Multiplies the mapped matrix by the columns of vectors, reading it one tile of rows at a time.
+        """
+        n = len(this.panels) + 1
+        result = np.empty((n, vectors.shape[1]))
+
+        def multiply(rowStart, rowStop):
+            result[rowStart:rowStop] = np.asarray(this.matrixA[rowStart:rowStop]) @ vectors
+
+        this.forEachTile(multiply)
+        result[-1] = np.asarray(this.matrixA[-1]) @ vectors
+        return result
+
+    def solve(this, tolerance: float = 1e-10, restart: int = 50, maxIterations: int = 1000):
+        """
+        Solves the two basis systems and streams the J matrix once more for their tangential velocities.
+        """
+        n = len(this.panels)
+        # The right hand sides at alpha = 0 and 90 degrees
+        basis = panelMethods.findSourceVortexRightHandSide(
+            this.delta[:, None] - np.array([0, math.pi / 2]), 1
+        )
+        diagonal = np.full(n + 1, math.pi)
+        diagonal[n] = this.matrixA[n, n]
+        this.solutions, this.products = solveGmres(
+            this.matvec, basis, diagonal, tolerance, restart, maxIterations
+        )
+        velocities = np.empty((n, 2))
+
+        def multiply(rowStart, rowStop):
+            matrixJ = panelMethods.findInfluenceBlock(this.arrays, rowStart, rowStop, "J")["J"]
+            velocities[rowStart:rowStop] = matrixJ @ this.solutions[:n]
+
+        this.forEachTile(multiply)
+        this.sourceVelocities = velocities
+
+    def findStrengths(this, freestreamVelocity, alphas) -> np.ndarray:
+        """
+        Finds the source strengths and vortex strength with one column per angle of attack (radians).
+        """
+        if this.solutions is None:
+            this.solve()
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        weights = velocity * np.vstack((np.cos(alphas), np.sin(alphas)))
+        return this.solutions @ weights
+
+    def findCoefficients(this, freestreamVelocity, alphas) -> list:
+        """
+        Finds the pressure, lift, drag and moment coefficients for each angle of attack (radians),
+        returned as a list of (cps, cl, cd, cm) in the order of the angles.
+        """
+        if this.solutions is None:
+            this.solve()
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        weights = velocity * np.vstack((np.cos(alphas), np.sin(alphas)))
+        beta = this.delta[:, None] - alphas[None, :]
+        v = panelMethods.findSourceVortexSurfaceVelocities(
+            this.sourceVelocities @ weights, this.sumL, beta, this.solutions[-1] @ weights, velocity
+        )
+        cps = 1 - (v / velocity) ** 2
+        cls, cds, cms = panelMethods.integrateForceCoefficients(
+            this.length, this.phi, this.xc, beta, cps, alphas
+        )
+        return [
+            (cps[:, k].tolist(), cls[k], cds[k], cms[k]) for k in range(len(alphas))
+        ]
+
+    def close(this):
+        """
+        Releases the mapped matrix, deleting its file if it was temporary. Closing again does nothing.
+        """
+        this.matrixA = None
+        if this.temporary and os.path.exists(this.fileName):
+            os.remove(this.fileName)
+
+    def __enter__(this):
+        return this
+
+    def __exit__(this, *exception):
+        this.close()
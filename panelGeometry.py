@@ -1,5 +1,6 @@
 import math
 import csv
+import numpy as np
 
 
 # Classes
@@ -76,6 +77,162 @@ def createPointsFromArrays(xs: list, ys: list) -> list:
     return points
 
 
+def createNacaPoints(
+    maxCamber: float, camberPosition: float, thickness: float, divisions: int
+) -> list:
+    """
+    Creates a list of points on a NACA 4-digit airfoil of unit chord with cosine spaced points on each surface.
+    The camber, its position and the thickness are fractions of the chord, ie 0.02, 0.4 and 0.12 for a NACA 2412.
+    As in the included geometry files, the thickness is added perpendicular to the chord so both surfaces share x values.
+    """
+    xs = []
+    ys = []
+    for index in range(2 * divisions + 1):
+        upper = index <= divisions
+        theta = math.pi * (index if upper else 2 * divisions - index) / divisions
+        x = (1 + math.cos(theta)) / 2
+        yt = 5 * thickness * (
+            0.2969 * math.sqrt(x) - 0.126 * x - 0.3516 * x ** 2 + 0.2843 * x ** 3 - 0.1015 * x ** 4
+        )
+        if maxCamber == 0 or camberPosition == 0:
+            yc = 0
+        elif x < camberPosition:
+            yc = maxCamber / camberPosition ** 2 * (2 * camberPosition * x - x ** 2)
+        else:
+            yc = maxCamber / (1 - camberPosition) ** 2 * (
+                1 - 2 * camberPosition + 2 * camberPosition * x - x ** 2
+            )
+        xs.append(x)
+        ys.append(yc + yt if upper else yc - yt)
+    return createPointsFromArrays(xs, ys)
+
+
+def fitCubicSpline(knots, values, periodic: bool = False):
+    """
+    Finds the second derivatives at the knots of a cubic spline through the values, which may have several columns.
+    The ends are natural, or for a periodic spline the last value must repeat the first.
+    """
+    h = np.diff(knots)
+    slopes = np.diff(values, axis=0) / h[:, None]
+    n = len(h)
+    if periodic:
+        previous = np.roll(h, 1)
+        matrix = np.zeros((n, n))
+        rows = np.arange(n)
+        matrix[rows, rows - 1] = previous
+        matrix[rows, rows] = 2 * (previous + h)
+        matrix[rows, (rows + 1) % n] += h
+        secondDerivatives = np.linalg.solve(matrix, 6 * (slopes - np.roll(slopes, 1, axis=0)))
+        return np.vstack((secondDerivatives, secondDerivatives[:1]))
+    matrix = np.eye(n + 1)
+    rows = np.arange(1, n)
+    matrix[rows, rows - 1] = h[:-1]
+    matrix[rows, rows] = 2 * (h[:-1] + h[1:])
+    matrix[rows, rows + 1] = h[1:]
+    right = np.zeros((n + 1, values.shape[1]))
+    right[1:-1] = 6 * (slopes[1:] - slopes[:-1])
+    return np.linalg.solve(matrix, right)
+
+
+def evaluateCubicSpline(knots, values, secondDerivatives, queries) -> tuple:
+    """
+    Evaluates a cubic spline and its first and second derivatives at the queries.
+    """
+    i = np.clip(np.searchsorted(knots, queries, side="right") - 1, 0, len(knots) - 2)
+    h = (knots[i + 1] - knots[i])[:, None]
+    a = (knots[i + 1] - queries)[:, None] / h
+    b = 1 - a
+    m0 = secondDerivatives[i]
+    m1 = secondDerivatives[i + 1]
+    value = a * values[i] + b * values[i + 1] + ((a ** 3 - a) * m0 + (b ** 3 - b) * m1) * h ** 2 / 6
+    first = (values[i + 1] - values[i]) / h - (3 * a ** 2 - 1) * h * m0 / 6 + (3 * b ** 2 - 1) * h * m1 / 6
+    second = a * m0 + b * m1
+    return value, first, second
+
+
+def repanelPoints(
+    points: list,
+    panelCount: int,
+    spacing: str = "cosine",
+    curvatureWeight: float = 1.0,
+    resolution: int = 20,
+) -> list:
+    """
+    Fits a parametric cubic spline to an ordered list of points and redistributes it so that createPanelsFromPoints
+    makes panelCount panels. Cosine spacing clusters points at the leading edge, the point farthest from the trailing
+    edge, and at the trailing edge. Curvature spacing places a share curvatureWeight / (1 + curvatureWeight) of the
+    points evenly in turning angle and the rest as cosine spacing would, or evenly in arc length for a closed loop.
+    A vertical trailing edge gap is kept, a closed trailing edge stays closed and is returned once as the last point, and
+    a body without a trailing edge, ie a cylinder, is fitted as a closed loop. The points are returned clockwise.
+    """
+    coordinates = np.array([[point.x, point.y] for point in points])
+    if np.all(coordinates[0] == coordinates[-1]):
+        shape = "closed"
+    elif coordinates[0, 0] == coordinates[-1, 0]:
+        shape = "open"
+    else:
+        shape = "loop"
+        coordinates = np.vstack((coordinates, coordinates[:1]))
+    # Parameterize by chord length, dropping repeated points
+    segments = np.hypot(*np.diff(coordinates, axis=0).T)
+    keep = np.concatenate(([True], segments > 0))
+    coordinates = coordinates[keep]
+    knots = np.concatenate(([0.0], np.cumsum(segments[segments > 0])))
+    secondDerivatives = fitCubicSpline(knots, coordinates, shape == "loop")
+
+    # Arc length and curvature on a fine grid
+    fine = np.union1d(knots, np.linspace(0, knots[-1], resolution * len(knots)))
+    value, first, second = evaluateCubicSpline(knots, coordinates, secondDerivatives, fine)
+    speed = np.hypot(first[:, 0], first[:, 1])
+    arc = np.concatenate(([0.0], np.cumsum((speed[1:] + speed[:-1]) / 2 * np.diff(fine))))
+    trailingEdge = (coordinates[0] + coordinates[-1]) / 2
+    leadingEdge = arc[np.argmax(np.hypot(*(value - trailingEdge).T))]
+    lowerCount = panelCount // 2
+    upperCount = panelCount - lowerCount
+    if spacing == "cosine":
+        targets = np.concatenate(
+            (
+                leadingEdge * (1 - np.cos(np.pi * np.arange(lowerCount) / lowerCount)) / 2,
+                leadingEdge
+                + (arc[-1] - leadingEdge)
+                * (1 - np.cos(np.pi * np.arange(upperCount + 1) / upperCount))
+                / 2,
+            )
+        )
+    elif spacing == "curvature":
+        if shape == "loop":
+            fraction = arc / arc[-1]
+        else:
+            # The fraction of the points cosine spacing places before each arc length
+            lower = np.arccos(np.clip(1 - 2 * arc / leadingEdge, -1, 1)) / math.pi
+            upper = np.arccos(
+                np.clip(1 - 2 * (arc - leadingEdge) / (arc[-1] - leadingEdge), -1, 1)
+            ) / math.pi
+            fraction = np.where(
+                arc <= leadingEdge,
+                lower * lowerCount,
+                lowerCount + upper * upperCount,
+            ) / panelCount
+        curvature = np.abs(first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0]) / speed ** 3
+        turning = np.concatenate(
+            ([0.0], np.cumsum((curvature[1:] + curvature[:-1]) / 2 * np.diff(arc)))
+        )
+        fraction = (fraction + curvatureWeight * turning / turning[-1]) / (1 + curvatureWeight)
+        targets = np.interp(np.linspace(0, 1, panelCount + 1), fraction, arc)
+    else:
+        raise Exception("Spacing must be cosine or curvature.")
+    parameters = np.interp(targets, arc, fine)
+    xys = evaluateCubicSpline(knots, coordinates, secondDerivatives, parameters)[0]
+    # Keep the end points exactly
+    xys[0] = coordinates[0]
+    xys[-1] = coordinates[-1]
+    if shape == "closed":
+        xys = xys[1:]
+    elif shape == "loop":
+        xys = xys[:-1]
+    return createPointsFromArrays(xys[:, 0].tolist(), xys[:, 1].tolist())
+
+
 def createPanelsFromPoints(points: list, alpha=0) -> list:
     """
     Creates a list of panels from an ordered list of points at the angle of attack alpha.
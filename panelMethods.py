@@ -1,24 +1,168 @@
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 import panelGeometry as pg
 import numpy as np
 
-def findSourcePanelStrengths(panels: list, freestreamVelocity: float) -> list:
+# Influence assembly options. The I/J/L matrices are assembled in blocks of rows
+# on a thread pool; NumPy releases the GIL inside its ufuncs so blocks overlap.
+assemblyWorkers = os.cpu_count() or 1
+assemblyBlockSize = 256
+# Approximate bytes of temporaries per influence matrix element while a block of rows is assembled and solved,
+# used to size blocks to a memory limit
+bytesPerElement = 16 * 8
+
+
+def getPanelArrays(panels: list) -> tuple:
+    """
+    Gathers the control points, start points, angles and lengths of the panels into arrays.
+    """
+    xc = np.array([panel.controlPoint.x for panel in panels])
+    yc = np.array([panel.controlPoint.y for panel in panels])
+    xs = np.array([panel.startPoint.x for panel in panels])
+    ys = np.array([panel.startPoint.y for panel in panels])
+    phi = np.array([panel.phi for panel in panels])
+    s = np.array([panel.length for panel in panels])
+    return xc, yc, xs, ys, phi, s
+
+
+def findInfluenceBlock(
+    arrays: tuple, rowStart: int, rowStop: int, kinds: str = "IJL", columnArrays: tuple = None
+) -> dict:
     """
-    Finds the source panel strengths using the source panel method.
+    Computes rows rowStart:rowStop of the requested I, J and L geometric integrals as block sized arrays.
+    Self influence (i == j) and terms whose control point lies on a panel end are zero, and the arctangent term
+    vanishes for collinear panels, which keeps their logarithmic part. The panel arrays may have leading batch axes,
+    ie (bodies, N) for a batch of bodies with the same panel count, which the blocks then share.
+    If columnArrays is given, the columns are the influence of those panels instead, ie of an image body.
     """
-    matrixA = []
-    matrixB = []
-    for i, paneli in enumerate(panels):
-        rowA = []
-        for j, panelj in enumerate(panels):
-            if i is j:
-                rowA.append(math.pi)
+    xc, yc, _, _, phi_i, _ = arrays
+    _, _, xs, ys, phi, s = arrays if columnArrays is None else columnArrays
+    rows = slice(rowStart, rowStop)
+    dx = xc[..., rows, None] - xs[..., None, :]
+    dy = yc[..., rows, None] - ys[..., None, :]
+    phi_i = phi_i[..., rows, None]
+    phi = phi[..., None, :]
+    s = s[..., None, :]
+    cos_j = np.cos(phi)
+    sin_j = np.sin(phi)
+    cos_i = np.cos(phi_i)
+    sin_i = np.sin(phi_i)
+    blocks = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = -dx * cos_j - dy * sin_j
+        b = dx ** 2 + dy ** 2
+        e = np.sqrt(np.maximum(b - a ** 2, 0))
+        endDistance = s ** 2 + 2 * a * s + b
+        singular = (b == 0) | (endDistance == 0)
+        logTerm = np.log(endDistance / b)
+        atanTerm = np.where(e > 0, (np.arctan((s + a) / e) - np.arctan(a / e)) / e, 0.0)
+        for kind in kinds:
+            if kind == "I":
+                c, d = np.sin(phi_i - phi), -dx * sin_i + dy * cos_i
+            elif kind == "J":
+                c, d = -np.cos(phi_i - phi), dx * cos_i + dy * sin_i
             else:
-                i_ij = pg.findIij(paneli, panelj)
-                rowA.append(i_ij)
-        matrixA.append(rowA)
-        rowB = -freestreamVelocity * 2 * math.pi * math.cos(paneli.beta)
-        matrixB.append(rowB)
+                c, d = np.sin(phi - phi_i), dx * sin_i - dy * cos_i
+            block = (c / 2) * logTerm + (d - a * c) * atanTerm
+            block[singular] = 0.0
+            if columnArrays is None:
+                block[..., np.arange(rowStop - rowStart), np.arange(rowStart, rowStop)] = 0.0
+            blocks[kind] = block
+    return blocks
+
+
+def mapConcurrently(function, tasks: list, workers: int = None) -> list:
+    """
+    Calls function on each task and returns the results in order. The tasks run on a thread pool unless there is
+    only one worker or one task.
+    """
+    workers = workers or assemblyWorkers
+    if workers == 1 or len(tasks) <= 1:
+        return [function(task) for task in tasks]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, tasks))
+
+
+def findInfluenceMatrices(
+    panels: list,
+    kinds: str = "IJL",
+    workers: int = None,
+    blockSize: int = None,
+    rows=None,
+    columnArrays: tuple = None,
+) -> tuple:
+    """
+    Assembles the requested geometric integral matrices (any of "I", "J" and "L") of every panel
+    relative to every other panel. Rows are split into blocks that are filled concurrently.
+    If rows is given, only those rows are assembled, in that order. If columnArrays is given, the columns are
+    the influence of those panels instead, as in findInfluenceBlock.
+    """
+    blockSize = blockSize or assemblyBlockSize
+    arrays = getPanelArrays(panels)
+    n = len(panels)
+    rows = np.arange(n) if rows is None else np.asarray(rows)
+    columns = n if columnArrays is None else len(columnArrays[0])
+    outputs = {kind: np.empty((len(rows), columns)) for kind in kinds}
+    # Split the rows into blocks of consecutive rows
+    blocks = []
+    for run in np.split(np.arange(len(rows)), np.nonzero(np.diff(rows) != 1)[0] + 1):
+        for start in range(0, len(run), blockSize):
+            blocks.append((int(run[start]), min(len(run) - start, blockSize)))
+
+    def fill(block):
+        position, count = block
+        rowStart = int(rows[position])
+        values = findInfluenceBlock(arrays, rowStart, rowStart + count, kinds, columnArrays)
+        for kind in kinds:
+            outputs[kind][position : position + count] = values[kind]
+
+    mapConcurrently(fill, blocks, workers)
+    return tuple(outputs[kind] for kind in kinds)
+
+
+def integrateForceCoefficients(length, phi, xc, beta, cps, alpha) -> tuple:
+    """
+    Integrates the pressure coefficients over the panels into the lift, drag and moment coefficients.
+    The cps and beta arrays may hold one column per angle of attack, with alpha an array of those angles.
+    The panel arrays may also hold one column per body, ie for a batch of bodies each at its own angle.
+    """
+    cps = np.asarray(cps)
+    shape = (-1,) + (1,) * (cps.ndim - 1)
+    if np.ndim(length) == 1:
+        length = np.reshape(length, shape)
+        phi = np.reshape(phi, shape)
+        xc = np.reshape(xc, shape)
+    cn = -cps * length * np.sin(beta)
+    ca = -cps * length * np.cos(beta)
+    cl = np.sum(cn, axis=0) * np.cos(alpha) - np.sum(ca, axis=0) * np.sin(alpha)
+    cd = np.sum(cn, axis=0) * np.sin(alpha) + np.sum(ca, axis=0) * np.cos(alpha)
+    cm = np.sum(cps * (xc - 0.25) * length * np.cos(phi), axis=0)
+    return cl, cd, cm
+
+
+def findForceCoefficients(panels: list, cps, alpha: float) -> tuple:
+    """
+    Integrates the pressure coefficients over the panels into the lift, drag and moment coefficients.
+    """
+    return integrateForceCoefficients(
+        np.array([panel.length for panel in panels]),
+        np.array([panel.phi for panel in panels]),
+        np.array([panel.controlPoint.x for panel in panels]),
+        np.array([panel.beta for panel in panels]),
+        cps,
+        alpha,
+    )
+
+
+def findSourcePanelStrengths(panels: list, freestreamVelocity: float, matrixI=None) -> list:
+    """
+    Finds the source panel strengths using the source panel method. The I matrix is assembled unless it is given.
+    """
+    matrixA = findInfluenceMatrices(panels, "I")[0] if matrixI is None else matrixI.copy()
+    np.fill_diagonal(matrixA, math.pi)
+    beta = np.array([panel.beta for panel in panels])
+    matrixB = -freestreamVelocity * 2 * math.pi * np.cos(beta)
     lambdas = np.linalg.solve(matrixA, matrixB)
     return lambdas
 
@@ -29,60 +173,31 @@ def findSourcePanelCoefficients(
     """
     Finds the pressure coefficient at each panel and the total lift and drag coefficients using the source panel method.
     """
-    cps = []
-    clFirstTerm = 0
-    clSecondTerm = 0
-    cdFirstTerm = 0
-    cdSecondTerm = 0
-    accuracy = 0
-    lambdas = findSourcePanelStrengths(panels, freestreamVelocity)
-    for i, paneli in enumerate(panels):
-        v = 0
-        accuracy += paneli.length * lambdas[i]
-        for j, panelj in enumerate(panels):
-            if i is j:
-                v += freestreamVelocity * math.sin(paneli.beta)
-            else:
-                j_ij = pg.findJij(paneli, panelj)
-                v += (lambdas[j] / (2 * math.pi)) * j_ij
-        cp = 1 - (v / freestreamVelocity) ** 2
-        cps.append(cp)
-        cn = -cp * paneli.length * math.sin(paneli.beta)
-        ca = -cp * paneli.length * math.cos(paneli.beta)
-        clFirstTerm += cn * math.cos(alpha)
-        clSecondTerm += ca * math.sin(alpha)
-        cdFirstTerm += cn * math.sin(alpha)
-        cdSecondTerm += ca * math.cos(alpha)
-    cl = clFirstTerm - clSecondTerm
-    cd = cdFirstTerm + cdSecondTerm
-    return cps, cl, cd, accuracy
-
-
-def findVortexPanelStrengths(panels: list, freestreamVelocity: float) -> list:
-    """
-    Finds the vortex panel strengths using the vortex panel method.
-    """
-    matrixA = []
-    matrixB = []
-    rowA = []
-    for i, paneli in enumerate(panels):
-        rowA = []
-        for j, panelj in enumerate(panels):
-            if i is j:
-                rowA.append(0)
-            else:
-                j_ij = pg.findJij(paneli, panelj)
-                rowA.append(-j_ij)
-        matrixA.append(rowA)
-        rowB = -freestreamVelocity * 2 * math.pi * math.cos(paneli.beta)
-        matrixB.append(rowB)
+    matrixI, matrixJ = findInfluenceMatrices(panels, "IJ")
+    lambdas = findSourcePanelStrengths(panels, freestreamVelocity, matrixI)
+    beta = np.array([panel.beta for panel in panels])
+    length = np.array([panel.length for panel in panels])
+    accuracy = np.sum(length * lambdas)
+    v = freestreamVelocity * np.sin(beta) + (matrixJ @ lambdas) / (2 * math.pi)
+    cps = 1 - (v / freestreamVelocity) ** 2
+    cl, cd, _ = findForceCoefficients(panels, cps, alpha)
+    return cps.tolist(), cl, cd, accuracy
+
+
+def findVortexPanelStrengths(panels: list, freestreamVelocity: float, matrixJ=None) -> list:
+    """
+    Finds the vortex panel strengths using the vortex panel method. The J matrix is assembled unless it is given.
+    """
+    if matrixJ is None:
+        (matrixJ,) = findInfluenceMatrices(panels, "J")
+    matrixA = -matrixJ
+    beta = np.array([panel.beta for panel in panels])
+    matrixB = -freestreamVelocity * 2 * math.pi * np.cos(beta)
     # Apply the Kutta condition
-    kuttaConditionA = [row * 0 for row in rowA]
-    kuttaConditionA[0] = 1
-    kuttaConditionA[-1] = 1
-    kuttaConditionB = 0
-    matrixA[-1] = kuttaConditionA
-    matrixB[-1] = kuttaConditionB
+    matrixA[-1] = 0
+    matrixA[-1, 0] = 1
+    matrixA[-1, -1] = 1
+    matrixB[-1] = 0
     gammas = np.linalg.solve(matrixA, matrixB)
     return gammas
 
@@ -93,126 +208,174 @@ def findVortexPanelCoefficients(
     """
     Finds the pressure coefficient at each panel and the total lift, drag, and moment coefficients using the vortex panel method.
     """
-    cps = []
-    clFirstTerm = 0
-    clSecondTerm = 0
-    cdFirstTerm = 0
-    cdSecondTerm = 0
-    accuracy = 0
-    cm = 0
-    gammas = findVortexPanelStrengths(panels, freestreamVelocity)
-    for i, paneli in enumerate(panels):
-        v = 0
-        accuracy += paneli.length * gammas[i]
-        for j, panelj in enumerate(panels):
-            if i is j:
-                v += freestreamVelocity * math.sin(paneli.beta) + gammas[i] / 2
-            else:
-                l_ij = pg.findLij(paneli, panelj)
-                v -= (gammas[j] / (2 * math.pi)) * l_ij
-        cp = 1 - (v / freestreamVelocity) ** 2
-        cps.append(cp)
-        cn = -cp * paneli.length * math.sin(paneli.beta)
-        ca = -cp * paneli.length * math.cos(paneli.beta)
-        clFirstTerm += cn * math.cos(alpha)
-        clSecondTerm += ca * math.sin(alpha)
-        cdFirstTerm += cn * math.sin(alpha)
-        cdSecondTerm += ca * math.cos(alpha)
-        cm += cp * (paneli.controlPoint.x - 0.25) * paneli.length * math.cos(paneli.phi)
-    cl = clFirstTerm - clSecondTerm
-    cd = cdFirstTerm + cdSecondTerm
-    return cps, cl, cd, cm, accuracy
+    matrixJ, matrixL = findInfluenceMatrices(panels, "JL")
+    gammas = findVortexPanelStrengths(panels, freestreamVelocity, matrixJ)
+    beta = np.array([panel.beta for panel in panels])
+    length = np.array([panel.length for panel in panels])
+    accuracy = np.sum(length * gammas)
+    v = (
+        freestreamVelocity * np.sin(beta)
+        + gammas / 2
+        - (matrixL @ gammas) / (2 * math.pi)
+    )
+    cps = 1 - (v / freestreamVelocity) ** 2
+    cl, cd, cm = findForceCoefficients(panels, cps, alpha)
+    return cps.tolist(), cl, cd, cm, accuracy
 
 
-def findSourceVortexPanelStrengths(panels: list, freestreamVelocity: float) -> list:
+def findSourceVortexMatrix(matrixI, matrixJ, matrixL) -> np.ndarray:
     """
-    Finds the source and vortex panel strengths using a source/vortex panel method.
+    Builds the (N + 1) x (N + 1) source/vortex system matrix, including the Kutta condition row, from the geometric integrals.
+    Leading batch axes of the integrals are kept, giving one system matrix per body.
     """
-    matrixA = []
-    matrixB = []
-    for i, paneli in enumerate(panels):
-        rowA = []
-        sumKs = 0
-        for j, panelj in enumerate(panels):
-            if i is j:
-                rowA.append(math.pi)
-            else:
-                i_ij = pg.findIij(paneli, panelj)
-                rowA.append(i_ij)
-                j_ij = pg.findJij(paneli, panelj)
-                sumKs += j_ij
-        rowA.append(-sumKs)
-        matrixA.append(rowA)
-        rowB = -freestreamVelocity * 2 * math.pi * math.cos(paneli.beta)
-        matrixB.append(rowB)
+    n = matrixI.shape[-1]
+    matrixA = np.empty(matrixI.shape[:-2] + (n + 1, n + 1))
+    matrixA[..., :n, :n] = matrixI
+    matrixA[..., np.arange(n), np.arange(n)] = math.pi
+    matrixA[..., :n, n] = -np.sum(matrixJ, axis=-1)
     # Apply the Kutta condition
-    rowA = []
-    sumLs = 0
-    for j, panelj in enumerate(panels):
-        summation = 0
-        if j != 0:
-            j_1j = pg.findJij(panels[0], panels[j])
-            summation += j_1j
-            l_1j = pg.findLij(panels[0], panels[j])
-            sumLs += l_1j
-        if j != len(panels) - 1:
-            j_Nj = pg.findJij(panels[-1], panels[j])
-            summation += j_Nj
-            l_Nj = pg.findLij(panels[-1], panels[j])
-            sumLs += l_Nj
-        rowA.append(summation)
-    rowA.append(-sumLs + 2 * math.pi)
-    matrixA.append(rowA)
-    rowB = (
-        -freestreamVelocity
-        * 2
-        * math.pi
-        * (math.sin(panels[0].beta) + math.sin(panels[-1].beta))
+    matrixA[..., n, :n] = matrixJ[..., 0, :] + matrixJ[..., -1, :]
+    matrixA[..., n, n] = (
+        -(np.sum(matrixL[..., 0, :], axis=-1) + np.sum(matrixL[..., -1, :], axis=-1)) + 2 * math.pi
+    )
+    return matrixA
+
+
+def findSourceVortexRightHandSide(beta, freestreamVelocity) -> np.ndarray:
+    """
+    Builds the right hand side of the source/vortex system, including the Kutta condition row.
+    Beta may hold one column per angle of attack or per body after the panel axis, and the freestream velocity may
+    be a scalar or hold one value per column.
+    """
+    beta = np.asarray(beta)
+    return -np.asarray(freestreamVelocity) * 2 * math.pi * np.concatenate(
+        (np.cos(beta), (np.sin(beta[0]) + np.sin(beta[-1]))[None])
     )
-    matrixB.append(rowB)
+
+
+def findSourceVortexPanelStrengths(panels: list, freestreamVelocity: float) -> list:
+    """
+    Finds the source and vortex panel strengths using a source/vortex panel method.
+    """
+    matrixA = findSourceVortexMatrix(*findInfluenceMatrices(panels, "IJL"))
+    beta = np.array([panel.beta for panel in panels])
+    matrixB = findSourceVortexRightHandSide(beta, freestreamVelocity)
     lambdasAndGamma = np.linalg.solve(matrixA, matrixB)
     return lambdasAndGamma
 
 
+def findSourceVortexSurfaceVelocities(
+    sourceVelocities, sumL, beta, gamma, freestreamVelocity
+) -> np.ndarray:
+    """
+    Finds the tangential surface velocity at each control point from the source term J lambda, the sum of each
+    row of L and the vortex strength. As in findSourceVortexRightHandSide, the arrays may hold one column per angle
+    of attack or per body after the panel axis, with gamma and the freestream velocity holding one value per column.
+    """
+    sumL = np.reshape(sumL, np.shape(sumL) + (1,) * (np.ndim(beta) - np.ndim(sumL)))
+    return (
+        freestreamVelocity * np.sin(beta)
+        + sourceVelocities / (2 * math.pi)
+        + gamma / 2
+        - (gamma / (2 * math.pi)) * sumL
+    )
+
+
 def findSourceVortexPanelCoefficients(
     panels: list, freestreamVelocity: float, alpha: float
 ) -> tuple:
     """
     Finds the pressure coefficient at each panel and the total lift, drag, and moment coefficients using a source/vortex panel method.
     """
-    cps = []
-    clFirstTerm = 0
-    clSecondTerm = 0
-    cdFirstTerm = 0
-    cdSecondTerm = 0
-    cm = 0
-    lambdasAndGamma = findSourceVortexPanelStrengths(panels, freestreamVelocity)
-    for i, paneli in enumerate(panels):
-        sumJ = 0
-        sumL = 0
-        gamma = lambdasAndGamma[-1]
-        for j, panelj in enumerate(panels):
-            if i != j:
-                lambd = lambdasAndGamma[j]
-                J_ij = pg.findJij(paneli, panelj)
-                sumJ += lambd * J_ij
-                L_ij = pg.findLij(paneli, panelj)
-                sumL += L_ij
-        v = (
-            freestreamVelocity * math.sin(paneli.beta)
-            + (1 / (2 * math.pi)) * sumJ
-            + gamma / 2
-            - (gamma / (2 * math.pi)) * sumL
+    matrixI, matrixJ, matrixL = findInfluenceMatrices(panels, "IJL")
+    matrixA = findSourceVortexMatrix(matrixI, matrixJ, matrixL)
+    beta = np.array([panel.beta for panel in panels])
+    matrixB = findSourceVortexRightHandSide(beta, freestreamVelocity)
+    lambdasAndGamma = np.linalg.solve(matrixA, matrixB)
+    v = findSourceVortexSurfaceVelocities(
+        matrixJ @ lambdasAndGamma[:-1],
+        np.sum(matrixL, axis=1),
+        beta,
+        lambdasAndGamma[-1],
+        freestreamVelocity,
+    )
+    cps = 1 - (v / freestreamVelocity) ** 2
+    cl, cd, cm = findForceCoefficients(panels, cps, alpha)
+    return cps.tolist(), cl, cd, cm
+
+
+class PanelSystem:
+    """
+    The angle of attack handling shared by the factorized panel systems of a rigid body. A subclass sets the delta,
+    length, phi and xc arrays of its panels and provides findSurfaceVelocities.
+    """
+
+    def findBetas(this, alphas) -> np.ndarray:
+        """
+        Finds the panel angles relative to the freestream with one column per angle of attack (radians).
+        """
+        return this.delta[:, None] - np.atleast_1d(alphas)[None, :]
+
+    def findCoefficients(this, freestreamVelocity, alphas, transpiration=None) -> list:
+        """
+        Finds the pressure, lift, drag and moment coefficients for each angle of attack (radians),
+        returned as a list of (cps, cl, cd, cm) in the order of the angles.
+        """
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        v = this.findSurfaceVelocities(velocity, alphas, transpiration)
+        cps = 1 - (v / velocity) ** 2
+        cls, cds, cms = integrateForceCoefficients(
+            this.length, this.phi, this.xc, this.findBetas(alphas), cps, alphas
+        )
+        return [
+            (cps[:, k].tolist(), cls[k], cds[k], cms[k]) for k in range(len(alphas))
+        ]
+
+
+class SourceVortexSystem(PanelSystem):
+    """
+    An assembled and factorized source/vortex panel system of a rigid body.
+    The system matrix does not depend on the angle of attack or freestream velocity, so it is inverted once
+    and any number of angles can then be solved together as columns of one right hand side.
+    """
+
+    def __init__(this, points: list, workers: int = None, blockSize: int = None):
+        this.panels = pg.createPanelsFromPoints(points)
+        this.matrixI, this.matrixJ, this.matrixL = findInfluenceMatrices(
+            this.panels, "IJL", workers, blockSize
+        )
+        this.matrixA = findSourceVortexMatrix(this.matrixI, this.matrixJ, this.matrixL)
+        this.inverseA = np.linalg.inv(this.matrixA)
+        this.length = np.array([panel.length for panel in this.panels])
+        this.phi = np.array([panel.phi for panel in this.panels])
+        this.delta = np.array([panel.delta for panel in this.panels])
+        this.xc = np.array([panel.controlPoint.x for panel in this.panels])
+        this.sumL = np.sum(this.matrixL, axis=1)
+
+    def findStrengths(this, freestreamVelocity, alphas, transpiration=None) -> np.ndarray:
+        """
+        Finds the source strengths and vortex strength with one column per angle of attack (radians).
+        The freestream velocity may be a scalar or one value per angle. An optional outward transpiration velocity
+        at each control point, ie from a boundary layer displacement, is added to the normal boundary condition.
+        """
+        beta = this.findBetas(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, beta.shape[1:])
+        matrixB = findSourceVortexRightHandSide(beta, velocity)
+        if transpiration is not None:
+            matrixB[:-1] += 2 * math.pi * np.reshape(transpiration, (len(beta), -1))
+        return this.inverseA @ matrixB
+
+    def findSurfaceVelocities(
+        this, freestreamVelocity, alphas, transpiration=None
+    ) -> np.ndarray:
+        """
+        Finds the tangential surface velocity at each control point with one column per angle of attack (radians).
+        """
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        beta = this.findBetas(alphas)
+        lambdasAndGamma = this.findStrengths(velocity, alphas, transpiration)
+        return findSourceVortexSurfaceVelocities(
+            this.matrixJ @ lambdasAndGamma[:-1], this.sumL, beta, lambdasAndGamma[-1], velocity
         )
-        cp = 1 - (v / freestreamVelocity) ** 2
-        cps.append(cp)
-        cn = -cp * paneli.length * math.sin(paneli.beta)
-        ca = -cp * paneli.length * math.cos(paneli.beta)
-        clFirstTerm += cn * math.cos(alpha)
-        clSecondTerm += ca * math.sin(alpha)
-        cdFirstTerm += cn * math.sin(alpha)
-        cdSecondTerm += ca * math.cos(alpha)
-        cm += cp * (paneli.controlPoint.x - 0.25) * paneli.length * math.cos(paneli.phi)
-    cl = clFirstTerm - clSecondTerm
-    cd = cdFirstTerm + cdSecondTerm
-    return cps, cl, cd, cm
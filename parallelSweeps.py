@@ -0,0 +1,291 @@
+import math
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+import panelGeometry as pg
+import panelMethods
+
+# Parallel Sweeps Over Shared Memory
+#
+# Geometry, assembled matrices and result buffers live in named shared memory segments. A task sent to a worker
+# process only holds the names, shapes and types of the segments it uses and a range of work; the worker attaches
+# to them by name, maps them as arrays without copying and writes its results in place. The process that creates
+# a workspace owns its segments and unlinks them when the workspace closes, whether or not the sweep failed, so no
+# segment outlives a sweep.
+
+
+class SharedWorkspace:
+    """
+    Owns a set of shared memory segments holding arrays. Use as a context manager so that the segments are unlinked
+    on exit, including after an error. Arrays read after the workspace closes must be copied out first.
+    """
+
+    def __init__(this):
+        this.segments = []
+
+    def create(this, shape, dtype=float) -> tuple:
+        """
+        Creates a zeroed shared array. Returns the array and its description, (name, shape, dtype), for attachArrays.
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(size) for size in np.atleast_1d(shape))
+        segment = shared_memory.SharedMemory(
+            create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+        )
+        this.segments.append(segment)
+        array = np.ndarray(shape, dtype, buffer=segment.buf)
+        array[...] = 0
+        return array, (segment.name, shape, dtype.str)
+
+    def share(this, values) -> tuple:
+        """
+        Copies the values into a new shared array once. Returns the array and its description.
+        """
+        values = np.asarray(values)
+        array, description = this.create(values.shape, values.dtype)
+        array[...] = values
+        return array, description
+
+    def close(this):
+        """
+        Unlinks every segment. Segments are closed too unless arrays still refer to them, in which case the mapping
+        is released once those arrays are garbage collected.
+        """
+        for segment in this.segments:
+            try:
+                segment.close()
+            except BufferError:
+                pass
+            finally:
+                segment.unlink()
+        this.segments = []
+
+    def __enter__(this):
+        return this
+
+    def __exit__(this, *exception):
+        this.close()
+
+
+def openSegment(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to a segment by name without registering it with this process's resource tracker. A worker started
+    before its parent created any segment has a tracker of its own, which would unlink the segment when the worker exits.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *arguments: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def attachArrays(descriptions: list) -> tuple:
+    """
+    Attaches to shared arrays by their descriptions. Returns the segments, which must be closed with detachSegments
+    once the arrays are no longer used, and the arrays.
+    """
+    segments = []
+    arrays = []
+    try:
+        for name, shape, dtype in descriptions:
+            segment = openSegment(name)
+            segments.append(segment)
+            arrays.append(np.ndarray(shape, np.dtype(dtype), buffer=segment.buf))
+    except Exception:
+        arrays = None
+        detachSegments(segments)
+        raise
+    return segments, arrays
+
+
+def detachSegments(segments: list):
+    """
+    Closes attached segments without unlinking them, as they belong to the workspace that created them.
+    """
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass
+
+
+def runTask(function, descriptions: list, *arguments):
+    """
+    Runs function(*arrays, *arguments) in a worker on the attached shared arrays. On an error the traceback frames
+    are cleared, so that they release the arrays, before the segments are closed and the error is raised.
+    """
+    segments, arrays = attachArrays(descriptions)
+    try:
+        function(*arrays, *arguments)
+    except Exception as error:
+        traceback.clear_frames(error.__traceback__)
+        raise
+    finally:
+        arrays = None
+        detachSegments(segments)
+
+
+def runTasks(executor, function, descriptions: list, taskArguments: list, workers: int = None):
+    """
+    Runs function on the shared arrays once per set of task arguments, on the executor or on a new process pool.
+    If a task fails, the pending tasks are cancelled and the running ones are waited for before the error is raised,
+    so that no worker is still attaching when the workspace is unlinked.
+    """
+    ownExecutor = executor is None
+    if ownExecutor:
+        executor = ProcessPoolExecutor(max_workers=workers or panelMethods.assemblyWorkers)
+    futures = []
+    try:
+        futures = [
+            executor.submit(runTask, function, descriptions, *arguments) for arguments in taskArguments
+        ]
+        for future in futures:
+            future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        if ownExecutor:
+            executor.shutdown(cancel_futures=True)
+
+
+def solveAlphaColumns(
+    inverseA, matrixJ, panelData, alphas, cps, coefficients, start: int, stop: int, freestreamVelocity: float
+):
+    """
+    Solves the angles of attack start:stop of a factorized source/vortex system, writing their cps and their cl, cd
+    and cm into the shared result arrays. Panel data holds the delta, length, phi, xc and sum of L of each panel.
+    """
+    delta, length, phi, xc, sumL = panelData
+    alphas = alphas[start:stop]
+    beta = delta[:, None] - alphas[None, :]
+    lambdasAndGamma = inverseA @ panelMethods.findSourceVortexRightHandSide(beta, freestreamVelocity)
+    v = panelMethods.findSourceVortexSurfaceVelocities(
+        matrixJ @ lambdasAndGamma[:-1], sumL, beta, lambdasAndGamma[-1], freestreamVelocity
+    )
+    cps[:, start:stop] = 1 - (v / freestreamVelocity) ** 2
+    coefficients[:, start:stop] = panelMethods.integrateForceCoefficients(
+        length, phi, xc, beta, cps[:, start:stop], alphas
+    )
+
+
+def solveBodies(
+    coordinates, offsets, alphas, cps, panelCounts, coefficients, start: int, stop: int, freestreamVelocity: float
+):
+    """
+    Assembles and solves the bodies start:stop of a packed geometry at every angle of attack, writing their cps,
+    panel counts and cl, cd and cm into the shared result arrays.
+    """
+    for body in range(start, stop):
+        points = [pg.Point(x, y) for x, y in coordinates[offsets[body] : offsets[body + 1]].tolist()]
+        system = panelMethods.SourceVortexSystem(points, workers=1)
+        v = system.findSurfaceVelocities(freestreamVelocity, alphas)
+        count = len(system.panels)
+        panelCounts[body] = count
+        cps[offsets[body] : offsets[body] + count] = 1 - (v / freestreamVelocity) ** 2
+        coefficients[body] = panelMethods.integrateForceCoefficients(
+            system.length,
+            system.phi,
+            system.xc,
+            system.findBetas(alphas),
+            cps[offsets[body] : offsets[body] + count],
+            alphas,
+        )
+
+
+def findChunks(count: int, chunkSize: int) -> list:
+    return [(start, min(start + chunkSize, count)) for start in range(0, count, chunkSize)]
+
+
+def sweepAlphas(
+    points: list,
+    alphas,
+    freestreamVelocity: float = 1,
+    workers: int = None,
+    chunkSize: int = None,
+    executor=None,
+) -> tuple:
+    """
+    Assembles and factorizes the source/vortex system of a body once, shares it and solves chunks of the angles of
+    attack (radians) on worker processes. Returns the cps, (N, alphas), and the cl, cd and cm arrays.
+    """
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+    workers = workers or panelMethods.assemblyWorkers
+    chunkSize = chunkSize or max(1, math.ceil(len(alphas) / workers))
+    system = panelMethods.SourceVortexSystem(points)
+    n = len(system.panels)
+    with SharedWorkspace() as workspace:
+        descriptions = [
+            workspace.share(system.inverseA)[1],
+            workspace.share(system.matrixJ)[1],
+            workspace.share(
+                np.vstack((system.delta, system.length, system.phi, system.xc, system.sumL))
+            )[1],
+            workspace.share(alphas)[1],
+        ]
+        cps, description = workspace.create((n, len(alphas)))
+        descriptions.append(description)
+        coefficients, description = workspace.create((3, len(alphas)))
+        descriptions.append(description)
+        runTasks(
+            executor,
+            solveAlphaColumns,
+            descriptions,
+            [chunk + (freestreamVelocity,) for chunk in findChunks(len(alphas), chunkSize)],
+            workers,
+        )
+        cps = cps.copy()
+        coefficients = coefficients.copy()
+    return cps, coefficients[0], coefficients[1], coefficients[2]
+
+
+def sweepGeometries(
+    pointsList: list,
+    alphas,
+    freestreamVelocity: float = 1,
+    workers: int = None,
+    chunkSize: int = 1,
+    executor=None,
+) -> list:
+    """
+    Packs the bodies into shared memory and assembles and solves chunks of them at every angle of attack (radians) on
+    worker processes. Returns a list of (cps, cl, cd, cm) per body, with cps of shape (N, alphas) and arrays of cl, cd and cm.
+    """
+    alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+    offsets = np.concatenate(([0], np.cumsum([len(points) for points in pointsList])))
+    with SharedWorkspace() as workspace:
+        coordinates, coordinatesDescription = workspace.create((offsets[-1], 2))
+        for points, start in zip(pointsList, offsets):
+            coordinates[start : start + len(points)] = [[point.x, point.y] for point in points]
+        descriptions = [
+            coordinatesDescription,
+            workspace.share(offsets)[1],
+            workspace.share(alphas)[1],
+        ]
+        cps, description = workspace.create((offsets[-1], len(alphas)))
+        descriptions.append(description)
+        panelCounts, description = workspace.create(len(pointsList), np.int64)
+        descriptions.append(description)
+        coefficients, description = workspace.create((len(pointsList), 3, len(alphas)))
+        descriptions.append(description)
+        runTasks(
+            executor,
+            solveBodies,
+            descriptions,
+            [chunk + (freestreamVelocity,) for chunk in findChunks(len(pointsList), chunkSize)],
+            workers,
+        )
+        results = [
+            (
+                cps[offsets[body] : offsets[body] + panelCounts[body]].copy(),
+                *coefficients[body].copy(),
+            )
+            for body in range(len(pointsList))
+        ]
+        coordinates = cps = panelCounts = coefficients = None
+    return results
@@ -0,0 +1,59 @@
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+import panelGeometry
+import panelMethods
+import parallelSweeps
+
+# Parallel Sweeps of a NACA 4-Digit Family Over Shared Memory
+
+# Inputs
+workers = 4
+divisions = 400  # Points per surface, giving 2 x divisions panels.
+thicknesses = [0.06, 0.09, 0.12, 0.15, 0.18]
+cambers = [0.0, 0.02, 0.04]
+camberPosition = 0.4
+alphaDegs = list(range(-10, 16))
+
+
+def solvePickled(points: list, alphas: list) -> list:
+    """
+    Solves one body, receiving pickled points and returning lists, for comparison.
+    """
+    return panelMethods.SourceVortexSystem(points, workers=1).findCoefficients(1, alphas)
+
+
+if __name__ == "__main__":
+    alphas = [alphaDeg * math.pi / 180 for alphaDeg in alphaDegs]
+    pointsList = [
+        panelGeometry.createNacaPoints(camber, camberPosition, thickness, divisions)
+        for thickness in thicknesses
+        for camber in cambers
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Warm up the worker processes
+        list(executor.map(abs, range(workers)))
+
+        start = time.perf_counter()
+        list(executor.map(solvePickled, pointsList, [alphas] * len(pointsList)))
+        pickled = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = parallelSweeps.sweepGeometries(pointsList, alphas, executor=executor)
+        shared = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cps, cls, cds, cms = parallelSweeps.sweepAlphas(
+            pointsList[0], [math.radians(alpha / 10) for alpha in range(-100, 151)], executor=executor
+        )
+        alphaSweep = time.perf_counter() - start
+
+    print(str.format("{} bodies of {} panels at {} angles", len(pointsList), 2 * divisions, len(alphas)))
+    print(str.format("Pickled objects and lists: {:.3f} s", pickled))
+    print(str.format("Shared memory:             {:.3f} s", shared))
+    print(str.format("251 angle sweep of one body, -10 to 15 degrees: {:.3f} s", alphaSweep))
+    for (thickness, camber), (cps, cl, cd, cm) in zip(
+        [(thickness, camber) for thickness in thicknesses for camber in cambers], results
+    ):
+        print(str.format("t = {:.2f}, m = {:.2f}: cl(0) = {:.4f}", thickness, camber, cl[alphaDegs.index(0)]))
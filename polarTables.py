@@ -0,0 +1,155 @@
+import itertools
+import json
+import os
+import numpy as np
+import symmetry
+
+# Precomputed Polar Tables
+#
+# A table file holds cl, cd and cm over a uniform grid of angles of attack for a set of named bodies.
+# The file is a short JSON header followed by one float64 array of shape (bodies, 3, alphas), aligned
+# so that it can be memory mapped. Processes that open the same file share its pages instead of copying it.
+
+magic = b"POLARTB1"
+alignment = 64
+coefficientNames = ("cl", "cd", "cm")
+
+
+def writePolarTable(
+    fileName: str, names: list, pointsList: list, alphas, parameters: list = None
+):
+    """
+    Computes the source/vortex polars of each body over the uniformly spaced angles of attack (radians) and writes
+    them to a table file. Parameters optionally holds a dictionary of family parameters per body, ie thickness and camber.
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    if len(alphas) < 2 or not np.allclose(np.diff(alphas), alphas[1] - alphas[0]):
+        raise Exception("The angles of attack must be uniformly spaced.")
+    if len(set(names)) != len(names):
+        raise Exception("Body names must be unique.")
+    parameters = parameters or [{} for _ in names]
+    data = np.empty((len(names), len(coefficientNames), len(alphas)))
+    for index, points in enumerate(pointsList):
+        system = symmetry.createSourceVortexSystem(points)
+        for column, (cps, cl, cd, cm) in enumerate(system.findCoefficients(1, alphas)):
+            data[index, :, column] = (cl, cd, cm)
+    header = {
+        "names": list(names),
+        "parameters": [dict(item) for item in parameters],
+        "alphaStart": float(alphas[0]),
+        "alphaStep": float(alphas[1] - alphas[0]),
+        "shape": list(data.shape),
+    }
+    headerBytes = json.dumps(header).encode()
+    offset = len(magic) + 8 + len(headerBytes)
+    padding = -offset % alignment
+    temporaryName = str.format("{}.{}.tmp", fileName, os.getpid())
+    with open(temporaryName, "wb") as file:
+        file.write(magic)
+        file.write(np.uint64(len(headerBytes) + padding).tobytes())
+        file.write(headerBytes + b" " * padding)
+        file.write(data.astype("<f8").tobytes())
+    os.replace(temporaryName, fileName)
+
+
+class PolarTable:
+    """
+    A read only, memory mapped polar table with vectorized interpolated lookups.
+    """
+
+    def __init__(this, fileName: str):
+        with open(fileName, "rb") as file:
+            if file.read(len(magic)) != magic:
+                raise Exception("The file is not a polar table.")
+            headerLength = int(np.frombuffer(file.read(8), dtype="<u8")[0])
+            header = json.loads(file.read(headerLength))
+        this.names = header["names"]
+        this.parameters = header["parameters"]
+        this.index = {name: row for row, name in enumerate(this.names)}
+        this.alphaStart = header["alphaStart"]
+        this.alphaStep = header["alphaStep"]
+        this.data = np.memmap(
+            fileName,
+            dtype="<f8",
+            mode="r",
+            offset=len(magic) + 8 + headerLength,
+            shape=tuple(header["shape"]),
+        )
+        this.alphas = this.alphaStart + this.alphaStep * np.arange(this.data.shape[2])
+
+    def findAlphaWeights(this, alphas) -> tuple:
+        """
+        Finds the lower grid index and interpolation weight of each angle of attack. Angles outside the grid are clamped.
+        """
+        position = (np.asarray(alphas, dtype=float) - this.alphaStart) / this.alphaStep
+        position = np.clip(position, 0, this.data.shape[2] - 1)
+        lower = np.minimum(position.astype(int), this.data.shape[2] - 2)
+        return lower, position - lower
+
+    def interpolate(this, rows, weights, alphas) -> tuple:
+        """
+        Interpolates the weighted sum of the table rows at the angles of attack and returns cl, cd and cm.
+        """
+        lower, fraction = this.findAlphaWeights(alphas)
+        result = 0
+        for row, weight in zip(rows, weights):
+            below = this.data[row][:, lower]
+            above = this.data[row][:, lower + 1]
+            result = result + weight * (below + fraction * (above - below))
+        return tuple(result)
+
+    def lookup(this, name: str, alphas) -> tuple:
+        """
+        Returns cl, cd and cm of the named body, linearly interpolated at the angles of attack (radians).
+        """
+        return this.interpolate([this.index[name]], [1.0], alphas)
+
+    def lookupFamily(this, alphas, **parameters) -> tuple:
+        """
+        Returns cl, cd and cm interpolated at the angles of attack (radians) and, multilinearly, at the family parameters,
+        ie lookupFamily(alphas, thickness=0.1, camber=0.03). The bodies with those parameters must form a full grid,
+        and every family parameter that varies between bodies at the same grid point must be given.
+        """
+        keys = sorted(parameters)
+        grid = {}
+        for row, bodyParameters in enumerate(this.parameters):
+            if all(key in bodyParameters for key in keys):
+                point = tuple(bodyParameters[key] for key in keys)
+                if point in grid:
+                    other = this.parameters[grid[point]]
+                    missing = sorted(
+                        key
+                        for key in set(other) | set(bodyParameters)
+                        if key not in keys and other.get(key) != bodyParameters.get(key)
+                    )
+                    if not missing:
+                        raise Exception("Several bodies in the table have the same family parameters.")
+                    raise Exception(
+                        str.format(
+                            "Several bodies have the requested parameters. Also give {}.", ", ".join(missing)
+                        )
+                    )
+                grid[point] = row
+        if not grid:
+            raise Exception("No bodies in the table have the requested parameters.")
+        axes = []
+        for axis, key in enumerate(keys):
+            values = sorted(set(point[axis] for point in grid))
+            value = min(max(parameters[key], values[0]), values[-1])
+            upper = min(max(np.searchsorted(values, value), 1), len(values) - 1)
+            if len(values) == 1:
+                axes.append([(values[0], 1.0)])
+                continue
+            lowerValue = values[upper - 1]
+            upperValue = values[upper]
+            fraction = (value - lowerValue) / (upperValue - lowerValue)
+            axes.append([(lowerValue, 1 - fraction), (upperValue, fraction)])
+        rows = []
+        weights = []
+        for corner in itertools.product(*axes):
+            point = tuple(value for value, _ in corner)
+            if point not in grid:
+                raise Exception("The bodies with the requested parameters do not form a full grid.")
+            rows.append(grid[point])
+            weights.append(np.prod([weight for _, weight in corner]))
+        return this.interpolate(rows, weights, alphas)
@@ -0,0 +1,70 @@
+import math
+import panelGeometry
+import plotting
+import panelMethods
+import matplotlib.pyplot as plt
+import os
+
+# Source/Vortex Panel Method of an Imported Body Repanelled to Several Panel Counts
+
+# Inputs
+freestreamVelocity = 1
+alphaDeg = 4
+fileName = "NACA-2412_Geom.txt"  # The data file must be in the same folder as this file.
+#   fileName = "NACA_0012_b.txt"  # The data file must be in the same folder as this file.
+#   fileName = "Cyl_Geom.txt"  # The data file must be in the same folder as this file.
+seperator = " "  # The seperator ie comma, space etc.
+panelCounts = [40, 80, 160, 320]
+spacing = "cosine"  # cosine or curvature
+
+# Convert alpha to radians
+alpha = alphaDeg * math.pi / 180
+
+# Import the data from the specified file and solve the original points.
+path = os.path.join(os.getcwd(), fileName)
+points = panelGeometry.importPoints(path, seperator)
+panels = panelGeometry.createPanelsFromPoints(points, alpha)
+cps, cl, cd, cm = panelMethods.findSourceVortexPanelCoefficients(
+    panels, freestreamVelocity, alpha
+)
+print(str.format("Original {} panels: cl = {:.4f}", len(panels), cl))
+
+# Plot the original cps
+plt.subplot(2, 1, 2)
+plotting.plotCps(points, cps, color="k", label=str.format("Original, {} panels", len(panels)))
+
+# Repanel and solve each panel count
+for index, panelCount in enumerate(panelCounts):
+    repanelled = panelGeometry.repanelPoints(points, panelCount, spacing)
+    panels = panelGeometry.createPanelsFromPoints(repanelled, alpha)
+    cps, cl, cd, cm = panelMethods.findSourceVortexPanelCoefficients(
+        panels, freestreamVelocity, alpha
+    )
+    print(str.format("{} panels: cl = {:.4f}", len(panels), cl))
+    plotting.plotCps(
+        repanelled, cps, color="C" + str(index), label=str.format("{} panels", len(panels))
+    )
+
+plt.gca().invert_yaxis()
+plt.legend(loc="upper right")
+
+# Plot the original points and the coarsest repanelling
+plt.subplot(2, 1, 1)
+plt.plot([point.x for point in points], [point.y for point in points], ".", c="k", label="Original")
+repanelled = panelGeometry.repanelPoints(points, panelCounts[0], spacing)
+plt.plot(
+    [point.x for point in repanelled],
+    [point.y for point in repanelled],
+    "o-",
+    mfc="none",
+    label=str(panelCounts[0]) + " panels",
+)
+plt.axis("equal")
+plt.xlabel("x")
+plt.ylabel("y")
+plt.legend(loc="upper right")
+plt.title(r'$\alpha = $' + str(alphaDeg) + u'\N{DEGREE SIGN}' + ", " + spacing + " spacing")
+
+plt.suptitle(os.path.splitext(fileName)[0])
+
+plt.show()
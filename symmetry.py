@@ -0,0 +1,240 @@
+import math
+import numpy as np
+import panelGeometry as pg
+import panelMethods
+
+# Mirror Symmetry About the Chord Line
+#
+# A body that is its own mirror image about a horizontal chord line has influence matrices that commute
+# with the mirror permutation, so the flow splits into a symmetric part, driven by the freestream along
+# the chord, and an antisymmetric part, driven by the freestream across it together with the circulation
+# and the Kutta condition. Each part is a half-size system over one panel of every mirror pair (plus any
+# panels on the chord line in the symmetric part), so only the influence rows of those panels are assembled
+# and each half is factorized at an eighth of the full cost. A part is only factorized once an angle of
+# attack needs it: the symmetric, non-lifting flow at zero alpha never builds the antisymmetric half.
+
+
+def findMirrorIndices(panels: list, tolerance: float = 1e-6) -> np.ndarray:
+    """
+    Finds the index of the mirror image of each panel about the horizontal chord line, or None if the body is not
+    symmetric within the tolerance, a fraction of the body size. Mirroring reverses the panel order.
+    """
+    xc, yc, xs, ys, phi, s = panelMethods.getPanelArrays(panels)
+    n = len(panels)
+    size = max(np.ptp(xs), np.ptp(ys))
+    # The perimeter weighted mean height of a symmetric body lies on its chord line
+    axis = np.sum(yc * s) / np.sum(s)
+    distance = np.hypot(xc - xc[0], yc - (2 * axis - yc[0]))
+    mirror = (int(np.argmin(distance)) - np.arange(n)) % n
+    # The start of each mirror panel is the reflected end of the panel
+    xe = xs + s * np.cos(phi)
+    ye = ys + s * np.sin(phi)
+    error = max(
+        np.max(np.abs(xs[mirror] - xe)),
+        np.max(np.abs(ys[mirror] - (2 * axis - ye))),
+        np.max(np.abs(s[mirror] - s)),
+    )
+    if not error <= tolerance * size:
+        return None
+    return mirror
+
+
+class SymmetricPanelSystem(panelMethods.PanelSystem):
+    """
+    A source (vortex=False) or source/vortex panel system of a body that is symmetric about its chord line,
+    solved as symmetric and antisymmetric half-size systems. It has the interface of panelMethods.SourceVortexSystem,
+    sharing findBetas and findCoefficients through panelMethods.PanelSystem, and its results match the full system.
+    """
+
+    def __init__(
+        this,
+        panels: list,
+        vortex: bool = True,
+        mirror=None,
+        tolerance: float = 1e-6,
+        workers: int = None,
+        blockSize: int = None,
+    ):
+        this.panels = panels
+        this.vortex = vortex
+        this.mirror = findMirrorIndices(panels, tolerance) if mirror is None else np.asarray(mirror)
+        if this.mirror is None:
+            raise Exception("The body is not symmetric about its chord line.")
+        n = len(panels)
+        if vortex and this.mirror[0] != n - 1:
+            raise Exception("The first and last panels must be mirror images for the Kutta condition.")
+        indices = np.arange(n)
+        # One panel of each mirror pair, and the panels on the chord line
+        this.half = indices[indices < this.mirror]
+        this.rows = indices[indices <= this.mirror]
+        this.halfPositions = np.searchsorted(this.rows, this.half)
+        this.length = np.array([panel.length for panel in panels])
+        this.phi = np.array([panel.phi for panel in panels])
+        this.delta = np.array([panel.delta for panel in panels])
+        this.xc = np.array([panel.controlPoint.x for panel in panels])
+
+        matrixI, this.matrixJ, matrixL = panelMethods.findInfluenceMatrices(
+            panels, "IJL" if vortex else "IJ", workers, blockSize, this.rows
+        ) + ((None,) if not vortex else ())
+        matrixI[np.arange(len(this.rows)), this.rows] = math.pi
+        this.matrixSymmetric = this.foldColumns(matrixI, this.rows, 1)
+        matrixAntisymmetric = this.foldColumns(matrixI[this.halfPositions], this.half, -1)
+        if vortex:
+            # The sums of the rows of L are the same for both panels of a mirror pair
+            this.sumL = np.empty(n)
+            this.sumL[this.rows] = np.sum(matrixL, axis=1)
+            this.sumL[this.mirror[this.half]] = this.sumL[this.half]
+            # The Kutta condition only involves the antisymmetric part
+            first = panelMethods.findInfluenceBlock(panelMethods.getPanelArrays(panels), 0, 1, "JL")
+            last = panelMethods.findInfluenceBlock(panelMethods.getPanelArrays(panels), n - 1, n, "JL")
+            m = len(this.half)
+            this.matrixAntisymmetric = np.empty((m + 1, m + 1))
+            this.matrixAntisymmetric[:m, :m] = matrixAntisymmetric
+            this.matrixAntisymmetric[:m, m] = -np.sum(this.matrixJ[this.halfPositions], axis=1)
+            this.matrixAntisymmetric[m, :m] = this.foldColumns(first["J"] + last["J"], this.half, -1)[0]
+            this.matrixAntisymmetric[m, m] = -(np.sum(first["L"]) + np.sum(last["L"])) + 2 * math.pi
+        else:
+            this.matrixAntisymmetric = matrixAntisymmetric
+        this.inverseSymmetric = None
+        this.inverseAntisymmetric = None
+
+    def foldColumns(this, matrix, columns, sign: int) -> np.ndarray:
+        """
+        Folds the mirror image columns of the matrix onto the given columns, adding them for a symmetric
+        solution (sign 1) and subtracting them for an antisymmetric one (sign -1).
+        """
+        mirrored = this.mirror[columns]
+        folded = matrix[:, columns] + sign * matrix[:, mirrored]
+        onAxis = mirrored == columns
+        folded[:, onAxis] = matrix[:, columns[onAxis]]
+        return folded
+
+    def findStrengthParts(this, freestreamVelocity, alphas, transpiration=None) -> tuple:
+        """
+        Finds the symmetric and antisymmetric parts of the source strengths and vortex strength with one column per
+        angle of attack (radians). A part is None when it is zero, and is only factorized once it is needed.
+        """
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        n = len(this.panels)
+        # The freestream along the chord drives the symmetric part and the freestream across it the antisymmetric part
+        normalX = -2 * math.pi * np.cos(this.delta)
+        normalY = -2 * math.pi * np.sin(this.delta)
+        matrixB = np.outer((normalX + normalX[this.mirror]) / 2, velocity * np.cos(alphas))
+        matrixC = np.outer((normalY - normalY[this.mirror]) / 2, velocity * np.sin(alphas))
+        if transpiration is not None:
+            transpiration = 2 * math.pi * np.reshape(transpiration, (n, -1))
+            matrixB = matrixB + (transpiration + transpiration[this.mirror]) / 2
+            matrixC = matrixC + (transpiration - transpiration[this.mirror]) / 2
+        matrixB = matrixB[this.rows]
+        matrixC = matrixC[this.half]
+        if this.vortex:
+            kutta = 2 * math.pi * (np.cos(this.delta[0]) + np.cos(this.delta[-1]))
+            matrixC = np.vstack((matrixC, kutta * velocity * np.sin(alphas)))
+        symmetric = None
+        antisymmetric = None
+        if np.any(matrixB):
+            if this.inverseSymmetric is None:
+                this.inverseSymmetric = np.linalg.inv(this.matrixSymmetric)
+            symmetric = this.inverseSymmetric @ matrixB
+        if np.any(matrixC):
+            if this.inverseAntisymmetric is None:
+                this.inverseAntisymmetric = np.linalg.inv(this.matrixAntisymmetric)
+            antisymmetric = this.inverseAntisymmetric @ matrixC
+        return symmetric, antisymmetric
+
+    def findStrengths(this, freestreamVelocity, alphas, transpiration=None) -> np.ndarray:
+        """
+        Finds the source strengths and vortex strength of every panel with one column per angle of attack (radians),
+        as panelMethods.SourceVortexSystem.findStrengths.
+        """
+        parts = this.findStrengthParts(freestreamVelocity, alphas, transpiration)
+        return this.expandStrengths(*parts, len(np.atleast_1d(alphas)))
+
+    def expandStrengths(this, symmetric, antisymmetric, count: int) -> np.ndarray:
+        """
+        Expands the parts of the strengths to every panel, as returned by panelMethods.SourceVortexSystem.findStrengths.
+        """
+        n = len(this.panels)
+        strengths = np.zeros((n + 1 if this.vortex else n, count))
+        if symmetric is not None:
+            strengths[this.rows] += symmetric
+            strengths[this.mirror[this.half]] += symmetric[this.halfPositions]
+        if antisymmetric is not None:
+            m = len(this.half)
+            strengths[this.half] += antisymmetric[:m]
+            strengths[this.mirror[this.half]] -= antisymmetric[:m]
+            if this.vortex:
+                strengths[n] = antisymmetric[m]
+        return strengths
+
+    def findSurfaceVelocities(this, freestreamVelocity, alphas, transpiration=None) -> np.ndarray:
+        """
+        Finds the tangential surface velocity at each control point with one column per angle of attack (radians).
+        """
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        parts = this.findStrengthParts(velocity, alphas, transpiration)
+        return this.findPartVelocities(*parts, velocity, alphas)
+
+    def findPartVelocities(this, symmetric, antisymmetric, freestreamVelocity, alphas) -> np.ndarray:
+        """
+        Finds the tangential surface velocities from parts of the strengths already found by findStrengthParts.
+        The velocity induced by a symmetric part changes sign on the mirror panel and that of an antisymmetric part does not.
+        """
+        alphas = np.atleast_1d(alphas)
+        velocity = np.broadcast_to(freestreamVelocity, alphas.shape)
+        count = len(alphas)
+        sourceVelocities = np.zeros((len(this.panels), count))
+        if symmetric is not None:
+            strengths = this.expandStrengths(symmetric, None, count)[: len(this.panels)]
+            part = this.matrixJ @ strengths
+            sourceVelocities[this.rows] += part
+            sourceVelocities[this.mirror[this.half]] -= part[this.halfPositions]
+        if antisymmetric is not None:
+            strengths = this.expandStrengths(None, antisymmetric, count)
+            part = this.matrixJ @ strengths[: len(this.panels)]
+            sourceVelocities[this.rows] += part
+            sourceVelocities[this.mirror[this.half]] += part[this.halfPositions]
+        beta = this.findBetas(alphas)
+        if not this.vortex:
+            return velocity * np.sin(beta) + sourceVelocities / (2 * math.pi)
+        gamma = antisymmetric[-1] if antisymmetric is not None else np.zeros(count)
+        return panelMethods.findSourceVortexSurfaceVelocities(
+            sourceVelocities, this.sumL, beta, gamma, velocity
+        )
+
+
+def createSourceVortexSystem(
+    points: list, tolerance: float = 1e-6, workers: int = None, blockSize: int = None
+):
+    """
+    Creates a SymmetricPanelSystem if the body is symmetric about its chord line within the tolerance,
+    and otherwise a panelMethods.SourceVortexSystem.
+    """
+    panels = pg.createPanelsFromPoints(points)
+    mirror = findMirrorIndices(panels, tolerance)
+    if mirror is None or mirror[0] != len(panels) - 1:
+        return panelMethods.SourceVortexSystem(points, workers, blockSize)
+    return SymmetricPanelSystem(panels, True, mirror, tolerance, workers, blockSize)
+
+
+def findSourcePanelCoefficients(
+    panels: list, freestreamVelocity: float, alpha: float, tolerance: float = 1e-6
+) -> tuple:
+    """
+    Finds the pressure coefficient at each panel and the total lift and drag coefficients using the source panel method,
+    as panelMethods.findSourcePanelCoefficients, solving half-size systems when the body is symmetric about its chord line.
+    """
+    mirror = findMirrorIndices(panels, tolerance)
+    if mirror is None:
+        return panelMethods.findSourcePanelCoefficients(panels, freestreamVelocity, alpha)
+    system = SymmetricPanelSystem(panels, False, mirror, tolerance)
+    # The panels were created at their own angle of attack, which sets the freestream direction
+    panelAlpha = panels[0].delta - panels[0].beta
+    symmetric, antisymmetric = system.findStrengthParts(freestreamVelocity, panelAlpha)
+    lambdas = system.expandStrengths(symmetric, antisymmetric, 1)[:, 0]
+    v = system.findPartVelocities(symmetric, antisymmetric, freestreamVelocity, panelAlpha)[:, 0]
+    cps = 1 - (v / freestreamVelocity) ** 2
+    cl, cd, _ = panelMethods.findForceCoefficients(panels, cps, alpha)
+    return cps.tolist(), cl, cd, np.sum(system.length * lambdas)
@@ -0,0 +1,242 @@
+import math
+import numpy as np
+import panelGeometry as pg
+import panelMethods
+
+# Unsteady Source/Vortex Panel Method
+#
+# The body is solved in its own frame. Pitching, plunging and gusts enter through the kinematic velocity
+# at the control points, so the body-body influence matrices are assembled once. Each step sheds a point
+# vortex from the trailing edge whose strength keeps the total circulation constant (Kelvin's theorem).
+# The wake is planar and frozen: vortices convect one slot per step along the mean freestream direction,
+# so the influence of every slot on the body is computed once, when the wake first reaches it. Vortices
+# older than maxWakeVortices are merged into one far wake vortex at their circulation weighted mean age,
+# which keeps the cost per step constant once the wake is that long.
+
+
+class UnsteadySourceVortexSolver:
+    """
+    A time stepping source/vortex panel method for a rigid body with a shed point vortex wake.
+    Alpha is the mean angle of attack (radians) and the pivot is the x location pitching motion is about.
+    """
+
+    def __init__(
+        this,
+        points: list,
+        freestreamVelocity: float,
+        alpha: float,
+        timeStep: float,
+        pivot: float = 0.25,
+        maxWakeVortices: int = 400,
+        shedFraction: float = 0.25,
+        coreRadius: float = 0.001,
+    ):
+        this.panels = pg.createPanelsFromPoints(points)
+        this.freestreamVelocity = freestreamVelocity
+        this.alpha = alpha
+        this.timeStep = timeStep
+        this.maxWakeVortices = maxWakeVortices
+        this.coreRadius = coreRadius
+        this.time = 0.0
+
+        # Body-body influence, assembled once
+        this.matrixI, this.matrixJ, this.matrixL = panelMethods.findInfluenceMatrices(
+            this.panels, "IJL"
+        )
+        this.length = np.array([panel.length for panel in this.panels])
+        this.phi = np.array([panel.phi for panel in this.panels])
+        this.delta = np.array([panel.delta for panel in this.panels])
+        this.xc = np.array([panel.controlPoint.x for panel in this.panels])
+        this.yc = np.array([panel.controlPoint.y for panel in this.panels])
+        this.normal = np.array([np.cos(this.delta), np.sin(this.delta)])
+        this.tangent = np.array([np.cos(this.phi), np.sin(this.phi)])
+        this.xr = this.xc - pivot
+        this.perimeter = np.sum(this.length)
+        this.sumL = np.sum(this.matrixL, axis=1)
+
+        # Wake slots along the mean freestream direction behind the trailing edge
+        trailingEdge = np.array(
+            [
+                (points[0].x + points[-1].x) / 2,
+                (points[0].y + points[-1].y) / 2,
+            ]
+        )
+        this.shedFraction = shedFraction
+        this.trailingEdge = trailingEdge
+        this.wakeStep = freestreamVelocity * timeStep * np.array([math.cos(alpha), math.sin(alpha)])
+        this.slotNormal = np.empty((maxWakeVortices, len(this.panels)))
+        this.slotTangent = np.empty((maxWakeVortices, len(this.panels)))
+        this.slotsComputed = 0
+        this.computeSlots(1)
+        this.wakeStrengths = np.zeros(maxWakeVortices)
+        this.wakeCount = 0
+        this.farStrength = 0.0
+        this.farWeight = 0.0
+        this.farAge = 0.0
+
+        # The newly shed vortex is always at slot 0 with strength P (gamma_previous - gamma), so its
+        # influence on the unknown gamma is constant and folds into the factorized system matrix.
+        this.matrixA = panelMethods.findSourceVortexMatrix(
+            this.matrixI, this.matrixJ, this.matrixL
+        )
+        n = len(this.panels)
+        shedTangent = this.slotTangent[0, 0] + this.slotTangent[0, -1]
+        this.matrixA[:n, n] -= 2 * math.pi * this.perimeter * this.slotNormal[0]
+        this.matrixA[n, n] -= 2 * math.pi * this.perimeter * shedTangent
+        this.inverseA = np.linalg.inv(this.matrixA)
+        this.gamma = 0.0
+        this.potential = None
+
+    def findVortexVelocity(this, age: float) -> tuple:
+        """
+        Finds the normal and tangential velocity induced at the control points by a unit clockwise vortex
+        that was shed the given number of steps ago.
+        """
+        position = this.trailingEdge + (age + this.shedFraction) * this.wakeStep
+        dx = this.xc - position[0]
+        dy = this.yc - position[1]
+        factor = 1 / (2 * math.pi * (dx ** 2 + dy ** 2 + this.coreRadius ** 2))
+        u = factor * dy
+        v = -factor * dx
+        return this.normal[0] * u + this.normal[1] * v, this.tangent[0] * u + this.tangent[1] * v
+
+    def computeSlots(this, count: int):
+        """
+        Computes the influence of a unit vortex in each wake slot that has not been reached before.
+        """
+        for slot in range(this.slotsComputed, count):
+            this.slotNormal[slot], this.slotTangent[slot] = this.findVortexVelocity(slot)
+        this.slotsComputed = max(this.slotsComputed, count)
+
+    def convectWake(this):
+        """
+        Moves every wake vortex one slot downstream, merging the oldest into the far wake vortex when the wake is full.
+        """
+        strengths = this.wakeStrengths
+        if this.farWeight:
+            this.farAge += 1
+        if this.wakeCount == this.maxWakeVortices:
+            oldest = strengths[-1]
+            weight = abs(oldest)
+            if weight:
+                this.farAge = (this.farAge * this.farWeight + this.maxWakeVortices * weight) / (
+                    this.farWeight + weight
+                )
+                this.farWeight += weight
+            this.farStrength += oldest
+            this.wakeCount -= 1
+        strengths[1 : this.wakeCount + 1] = strengths[: this.wakeCount].copy()
+        strengths[0] = 0.0
+        this.wakeCount += 1
+        this.computeSlots(this.wakeCount)
+
+    def step(
+        this, pitch: float = 0.0, pitchRate: float = 0.0, plungeRate: float = 0.0, gust=0.0
+    ) -> tuple:
+        """
+        Advances one time step with the given pitch angle (radians, nose up), pitch rate, upward plunge velocity and
+        upward gust velocity (a scalar or one value per control point). Returns the cps and the cl, cd and cm.
+        """
+        this.time += this.timeStep
+        if this.wakeCount:
+            this.convectWake()
+        n = len(this.panels)
+        angle = this.alpha + pitch
+        cosA = math.cos(angle)
+        sinA = math.sin(angle)
+        gust = np.broadcast_to(np.asarray(gust, dtype=float), (n,))
+
+        # Kinematic velocity of the fluid relative to the body, plus the velocity induced by the older wake
+        u = (
+            this.freestreamVelocity * cosA
+            + plungeRate * sinA
+            - pitchRate * this.yc
+            - gust * sinA
+        )
+        v = (
+            this.freestreamVelocity * sinA
+            - plungeRate * cosA
+            + pitchRate * this.xr
+            + gust * cosA
+        )
+        oldWake = this.wakeStrengths[1 : this.wakeCount]
+        oldSlots = slice(1, this.wakeCount)
+        normalVelocity = this.normal[0] * u + this.normal[1] * v
+        tangentVelocity = this.tangent[0] * u + this.tangent[1] * v
+        wakeNormal = oldWake @ this.slotNormal[oldSlots]
+        wakeTangent = oldWake @ this.slotTangent[oldSlots]
+        if this.farStrength:
+            farNormal, farTangent = this.findVortexVelocity(this.farAge)
+            wakeNormal += this.farStrength * farNormal
+            wakeTangent += this.farStrength * farTangent
+
+        # Solve for the source strengths and vortex strength
+        shedScale = 2 * math.pi * this.perimeter * this.gamma
+        matrixB = np.empty(n + 1)
+        matrixB[:n] = -2 * math.pi * (normalVelocity + wakeNormal) - shedScale * this.slotNormal[0]
+        matrixB[n] = -2 * math.pi * (
+            tangentVelocity[0] + wakeTangent[0] + tangentVelocity[-1] + wakeTangent[-1]
+        ) - shedScale * (this.slotTangent[0, 0] + this.slotTangent[0, -1])
+        lambdasAndGamma = this.inverseA @ matrixB
+        lambdas = lambdasAndGamma[:-1]
+        gamma = lambdasAndGamma[-1]
+        shed = this.perimeter * (this.gamma - gamma)
+        this.wakeStrengths[0] = shed
+        this.wakeCount = max(this.wakeCount, 1)
+        this.gamma = gamma
+
+        # Surface velocity and unsteady pressure coefficient
+        surfaceVelocity = (
+            tangentVelocity
+            + wakeTangent
+            + shed * this.slotTangent[0]
+            + (this.matrixJ @ lambdas) / (2 * math.pi)
+            + gamma / 2
+            - (gamma / (2 * math.pi)) * this.sumL
+        )
+        potential = this.findSurfacePotential(surfaceVelocity - tangentVelocity)
+        if this.potential is None:
+            potentialRate = np.zeros(n)
+        else:
+            potentialRate = (potential - this.potential) / this.timeStep
+        this.potential = potential
+        cps = (
+            u ** 2 + v ** 2 - surfaceVelocity ** 2 - 2 * potentialRate
+        ) / this.freestreamVelocity ** 2
+        beta = this.delta - angle
+        cl, cd, cm = panelMethods.integrateForceCoefficients(
+            this.length, this.phi, this.xc, beta, cps, angle
+        )
+        return cps.tolist(), cl, cd, cm
+
+    def findSurfacePotential(this, perturbationVelocity) -> np.ndarray:
+        """
+        Integrates the perturbation tangential velocity along the surface into the perturbation potential at each
+        control point, taking the mean of the two trailing edge values as zero.
+        """
+        steps = (perturbationVelocity[1:] + perturbationVelocity[:-1]) / 2 * (
+            this.length[1:] + this.length[:-1]
+        ) / 2
+        potential = np.concatenate(([0.0], np.cumsum(steps)))
+        return potential - (potential[0] + potential[-1]) / 2
+
+    def simulate(this, steps: int, pitch=None, plunge=None, gust=None) -> dict:
+        """
+        Runs a number of steps with optional motion functions of time: pitch(t) in radians, plunge(t) upward
+        displacement and gust(x, t) upward velocity at the control point x values. Rates are found by central differences.
+        """
+        history = {"time": [], "cl": [], "cd": [], "cm": [], "cps": []}
+        h = this.timeStep * 1e-3
+        for _ in range(steps):
+            t = this.time + this.timeStep
+            pitchAngle = pitch(t) if pitch else 0.0
+            pitchRate = (pitch(t + h) - pitch(t - h)) / (2 * h) if pitch else 0.0
+            plungeRate = (plunge(t + h) - plunge(t - h)) / (2 * h) if plunge else 0.0
+            gustVelocity = gust(this.xc, t) if gust else 0.0
+            cps, cl, cd, cm = this.step(pitchAngle, pitchRate, plungeRate, gustVelocity)
+            history["time"].append(this.time)
+            history["cl"].append(cl)
+            history["cd"].append(cd)
+            history["cm"].append(cm)
+            history["cps"].append(cps)
+        return history
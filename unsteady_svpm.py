@@ -0,0 +1,48 @@
+import math
+import panelGeometry
+import unsteadyPanelMethod
+import matplotlib.pyplot as plt
+import os
+
+# Unsteady Source/Vortex Panel Method of a Pitching Body
+
+# Inputs
+freestreamVelocity = 1
+alphaDeg = 0  # Mean angle of attack.
+amplitudeDeg = 2  # Pitch amplitude about the quarter chord.
+reducedFrequency = 0.1  # k = omega c / (2 U) with a unit chord.
+timeStep = 0.02
+steps = 2000
+fileName = "NACA_0012_b.txt"  # The data file must be in the same folder as this file.
+seperator = " "  # The seperator ie comma, space etc.
+
+# Convert to radians
+alpha = alphaDeg * math.pi / 180
+amplitude = amplitudeDeg * math.pi / 180
+omega = 2 * reducedFrequency * freestreamVelocity
+
+
+def pitch(t):
+    return amplitude * math.sin(omega * t)
+
+
+# Import the data from the specified file and create points.
+path = os.path.join(os.getcwd(), fileName)
+points = panelGeometry.importPoints(path, seperator)
+
+# Run the simulation
+solver = unsteadyPanelMethod.UnsteadySourceVortexSolver(
+    points, freestreamVelocity, alpha, timeStep
+)
+history = solver.simulate(steps, pitch=pitch)
+
+# Plot the cl against time with the quasi-steady thin airfoil value
+quasiSteady = [2 * math.pi * (alpha + pitch(t)) for t in history["time"]]
+plt.plot(history["time"], history["cl"], label="Unsteady")
+plt.plot(history["time"], quasiSteady, "--", c="k", label="Quasi-steady")
+plt.xlabel("$t U / c$")
+plt.ylabel("$c_l$")
+plt.title(str.format("k = {}", reducedFrequency))
+plt.suptitle(os.path.splitext(fileName)[0])
+plt.legend(loc="upper right")
+plt.show()
@@ -0,0 +1,287 @@
+import numpy as np
+import panelMethods
+import symmetry
+
+# Viscous/Inviscid Coupling of the Source/Vortex Panel Method
+#
+# An integral boundary layer is marched along the upper and lower surfaces from the stagnation point using
+# the panel surface velocities: Thwaites' method while laminar, Michel's criterion (or laminar separation) for
+# transition and Head's method once turbulent. The displacement thickness feeds back into the panel system as
+# an outward transpiration velocity d(ue delta*)/ds, which only changes the right hand side, so every coupling
+# iteration reuses the factorized inviscid matrix. The drag comes from the trailing edge momentum thickness
+# through the Squire-Young formula. Velocities are relative to the freestream and lengths to a unit chord.
+
+turbulentSeparationShapeFactor = 2.4
+
+
+def findLaminarShapeFactor(lam):
+    """
+    Thwaites' shape factor H as a function of the pressure gradient parameter lambda.
+    """
+    return np.where(
+        lam >= 0,
+        2.61 - 3.75 * lam + 5.24 * lam ** 2,
+        2.088 + 0.0731 / (lam + 0.14),
+    )
+
+
+def findLaminarShear(lam):
+    """
+    Thwaites' shear correlation l(lambda), where cf = 2 l / Re_theta.
+    """
+    return np.where(
+        lam >= 0,
+        0.22 + 1.57 * lam - 1.8 * lam ** 2,
+        0.22 + 1.402 * lam + 0.018 * lam / (lam + 0.107),
+    )
+
+
+def findHeadShapeFactor(h: float) -> float:
+    """
+    Head's entrainment shape factor H1 as a function of the shape factor H.
+    """
+    if h <= 1.6:
+        return 3.3 + 0.8234 * (h - 1.1) ** -1.287
+    return 3.3 + 1.5501 * (h - 0.6778) ** -3.064
+
+
+def findShapeFactorFromHead(h1: float) -> float:
+    """
+    The inverse of findHeadShapeFactor.
+    """
+    if h1 <= 3.32:
+        return 3.0
+    if h1 < 5.3:
+        return 0.6778 + 1.1536 * (h1 - 3.3) ** -0.326
+    return 1.1 + 0.86 * (h1 - 3.3) ** -0.777
+
+
+def solveBoundaryLayer(s, ue, reynoldsNumber: float) -> dict:
+    """
+    Marches an integral boundary layer along one surface given the arc length from the stagnation point and the
+    edge velocity at each station. Returns the momentum thickness, shape factor, displacement thickness and skin
+    friction at each station with the transition and separation station indices (None if they do not occur).
+    """
+    s = np.asarray(s, dtype=float)
+    ue = np.maximum(np.asarray(ue, dtype=float), 1e-6)
+    nu = 1 / reynoldsNumber
+    count = len(s)
+    dueds = np.gradient(ue, s) if count > 1 else np.zeros(count)
+
+    # Laminar: Thwaites' integral, starting with ue = 0 at the stagnation point
+    segments = np.diff(np.concatenate(([0.0], s)))
+    ue5 = ue ** 5
+    integrand = np.concatenate(([0.0], ue5))
+    integral = np.cumsum((integrand[1:] + integrand[:-1]) / 2 * segments)
+    theta = np.sqrt(0.45 * nu * integral / ue ** 6)
+    lam = np.clip(theta ** 2 / nu * dueds, -0.09, 0.25)
+    shape = findLaminarShapeFactor(lam)
+    cf = 2 * nu * findLaminarShear(lam) / (ue * theta + 1e-300)
+
+    # Transition: Michel's criterion or laminar separation
+    reTheta = ue * theta / nu
+    reX = np.maximum(ue * s / nu, 1.0)
+    michel = 1.174 * (1 + 22400 / reX) * reX ** 0.46
+    laminarSeparation = theta ** 2 / nu * dueds < -0.09
+    candidates = np.nonzero(((reTheta > michel) | laminarSeparation) & (s > 0))[0]
+    transition = int(candidates[0]) if len(candidates) else None
+    separation = None
+
+    # Turbulent: Head's method, continuing the momentum thickness from transition. The march is sequential, so
+    # the step sizes, velocity gradients and midpoint velocities are found up front and the loop runs on floats.
+    if transition is not None:
+        t = float(theta[transition])
+        h = 1.4
+        y = ue[transition] * t * findHeadShapeFactor(h)
+        shape[transition] = h
+        cf[transition] = 0.246 * 10 ** (-0.678 * h) * max(ue[transition] * t / nu, 1.0) ** -0.268
+        steps = np.diff(s[transition:])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = np.where(steps > 0, np.diff(ue[transition:]) / steps, 0.0)
+        ueMids = (ue[transition + 1 :] + ue[transition:-1]) / 2
+        ues = ue[transition + 1 :].tolist()
+        thetas = []
+        shapes = []
+        for i, ds, slope, ueMid, ueEnd in zip(
+            range(transition + 1, count), steps.tolist(), slopes.tolist(), ueMids.tolist(), ues
+        ):
+            # Midpoint method with H held at its value at the start of the step: the momentum thickness at the
+            # middle of the step is found by two fixed point iterations
+            shear = 0.123 * 10 ** (-0.678 * h)
+            pressure = (h + 2) / ueMid * slope
+            tMid = t
+            for _ in range(2):
+                dtds = shear * max(ueMid * tMid / nu, 1.0) ** -0.268 - pressure * tMid
+                tMid = t + dtds * ds / 2
+            dyds = ueMid * 0.0306 * max(findHeadShapeFactor(h) - 3, 1e-6) ** -0.6169
+            t = max(t + dtds * ds, 1e-12)
+            y = y + dyds * ds
+            h = findShapeFactorFromHead(y / (ueEnd * t))
+            if h >= turbulentSeparationShapeFactor:
+                if separation is None:
+                    separation = i
+                h = turbulentSeparationShapeFactor
+                y = ueEnd * t * findHeadShapeFactor(h)
+            thetas.append(t)
+            shapes.append(h)
+        turbulent = slice(transition + 1, count)
+        theta[turbulent] = thetas
+        shape[turbulent] = shapes
+        cf[turbulent] = (
+            0.246 * 10 ** (-0.678 * shape[turbulent]) * np.maximum(ue[turbulent] * theta[turbulent] / nu, 1.0) ** -0.268
+        )
+    return {
+        "theta": theta,
+        "shapeFactor": shape,
+        "displacement": shape * theta,
+        "cf": cf,
+        "transition": transition,
+        "separation": separation,
+    }
+
+
+class ViscousSourceVortexSolver:
+    """
+    Couples an integral boundary layer to a factorized source/vortex panel system of a rigid body.
+    Each solve starts from the displacement thickness of the previous one, so a polar swept in order is warm started.
+    There is no wake model, so the transpiration is ramped to zero over trailingEdgeTaper of the chord ahead of the
+    trailing edge, where the inviscid velocity falls to the trailing edge stagnation point.
+    """
+
+    def __init__(
+        this,
+        points: list,
+        reynoldsNumber: float,
+        relaxation: float = 0.5,
+        tolerance: float = 1e-4,
+        maxIterations: int = 300,
+        trailingEdgeTaper: float = 0.05,
+        system: panelMethods.SourceVortexSystem = None,
+    ):
+        this.system = system or symmetry.createSourceVortexSystem(points)
+        this.reynoldsNumber = reynoldsNumber
+        this.relaxation = relaxation
+        this.tolerance = tolerance
+        this.maxIterations = maxIterations
+        count = len(this.system.panels)
+        this.displacement = np.zeros(count)
+        this.iterations = 0
+        this.converged = False
+        this.boundaryLayers = {}
+        this.polarIterations = []
+        this.polarConverged = []
+        # Distance along the surface between consecutive control points
+        this.spacing = (this.system.length[1:] + this.system.length[:-1]) / 2
+        xs = [panel.startPoint.x for panel in this.system.panels]
+        chord = max(xs) - min(xs)
+        this.taper = np.clip((max(xs) - this.system.xc) / (trailingEdgeTaper * chord), 0, 1)
+
+    def findSurfaces(this, v) -> tuple:
+        """
+        Splits the control points at the stagnation point into the upper and lower surfaces, ordered from the
+        stagnation point to the trailing edge, with the arc length of each point from the stagnation point.
+        """
+        crossings = np.nonzero((v[:-1] <= 0) & (v[1:] > 0))[0]
+        if len(crossings):
+            i = int(crossings[np.argmin(np.abs(crossings - len(v) / 2))])
+        else:
+            i = int(np.argmin(np.abs(v[:-1] - v[1:])))
+        fraction = -v[i] / (v[i + 1] - v[i]) if v[i + 1] != v[i] else 0.5
+        fraction = min(max(fraction, 0.0), 1.0)
+        upper = np.arange(i + 1, len(v))
+        lower = np.arange(i, -1, -1)
+        upperS = (1 - fraction) * this.spacing[i] + np.concatenate(
+            ([0.0], np.cumsum(this.spacing[i + 1 :]))
+        )
+        lowerS = fraction * this.spacing[i] + np.concatenate(
+            ([0.0], np.cumsum(this.spacing[:i][::-1]))
+        )
+        return (upper, upperS), (lower, lowerS)
+
+    def solveBoundaryLayers(this, v) -> tuple:
+        """
+        Solves the boundary layer on both surfaces for the surface velocities. Returns the displacement thickness at each
+        control point and the Squire-Young drag coefficient, and keeps each surface's solution in this.boundaryLayers.
+        """
+        displacement = np.zeros(len(v))
+        cd = 0.0
+        this.boundaryLayers = {}
+        for name, (indices, s) in zip(("upper", "lower"), this.findSurfaces(v)):
+            ue = np.abs(v[indices])
+            layer = solveBoundaryLayer(s, ue, this.reynoldsNumber)
+            layer["indices"] = indices
+            layer["s"] = s
+            this.boundaryLayers[name] = layer
+            displacement[indices] = layer["displacement"]
+            theta = layer["theta"][-1]
+            h = layer["shapeFactor"][-1]
+            cd += 2 * theta * ue[-1] ** ((h + 5) / 2)
+        return displacement, cd
+
+    def findTranspiration(this, v, displacement) -> np.ndarray:
+        """
+        Finds the outward transpiration velocity d(ue delta*)/ds at each control point.
+        """
+        transpiration = np.zeros(len(v))
+        for indices, s in this.findSurfaces(v):
+            if len(s) > 1:
+                transpiration[indices] = np.gradient(np.abs(v[indices]) * displacement[indices], s)
+        return transpiration * this.taper
+
+    def solve(this, alpha: float) -> tuple:
+        """
+        Finds the viscous pressure coefficients and the lift, drag and moment coefficients at the angle of attack (radians).
+        Past the onset of large separations the coupling stops converging, which is reported by this.converged.
+        The relaxation is reduced whenever an iteration changes the surface velocity more than the one before it,
+        and an iteration that diverges is discarded and retried with half the relaxation.
+        """
+        this.converged = False
+        system = this.system
+        start = this.displacement.copy()
+        v = system.findSurfaceVelocities(1, alpha)[:, 0]
+        v = system.findSurfaceVelocities(1, alpha, this.findTranspiration(v, this.displacement))[:, 0]
+        relaxation = this.relaxation
+        lastChange = np.inf
+        for this.iterations in range(1, this.maxIterations + 1):
+            target, _ = this.solveBoundaryLayers(v)
+            displacement = this.displacement + relaxation * (target - this.displacement)
+            transpiration = this.findTranspiration(v, displacement)
+            previous = v
+            v = system.findSurfaceVelocities(1, alpha, transpiration)[:, 0]
+            change = np.max(np.abs(v - previous))
+            if not change < 1:
+                v = previous
+                relaxation = max(relaxation / 2, 0.01)
+                continue
+            this.displacement = displacement
+            if change < this.tolerance:
+                this.converged = True
+                break
+            if change > lastChange:
+                relaxation = max(relaxation * 0.7, 0.05)
+            lastChange = change
+        _, cd = this.solveBoundaryLayers(v)
+        if not this.converged:
+            # Keep the warm start state of the last converged solve for the next angle
+            this.displacement = start
+        cps = 1 - v ** 2
+        beta = system.findBetas(alpha)[:, 0]
+        cl, _, cm = panelMethods.integrateForceCoefficients(
+            system.length, system.phi, system.xc, beta, cps, alpha
+        )
+        return cps.tolist(), cl, cd, cm
+
+    def findPolar(this, alphas) -> list:
+        """
+        Solves each angle of attack (radians) in order, warm starting each from the previous converged displacement.
+        Returns a list of (cps, cl, cd, cm), with the iteration count and convergence of each angle in
+        this.polarIterations and this.polarConverged.
+        """
+        results = []
+        this.polarIterations = []
+        this.polarConverged = []
+        for alpha in alphas:
+            results.append(this.solve(alpha))
+            this.polarIterations.append(this.iterations)
+            this.polarConverged.append(this.converged)
+        return results
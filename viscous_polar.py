@@ -0,0 +1,47 @@
+import math
+import panelGeometry
+import panelMethods
+import viscousPanelMethod
+import matplotlib.pyplot as plt
+import os
+
+# Viscous Polar of an Imported Body
+
+# Inputs
+reynoldsNumber = 3e6
+alphaMinDeg = -4
+alphaMaxDeg = 12
+fileName = "NACA_0012_b.txt"  # The data file must be in the same folder as this file.
+#   fileName = "NACA-2412_Geom.txt"  # The data file must be in the same folder as this file.
+seperator = " "  # The seperator ie comma, space etc.
+
+# Convert alpha to radians
+alphaDegs = list(range(alphaMinDeg, alphaMaxDeg + 1))
+alphas = [alphaDeg * math.pi / 180 for alphaDeg in alphaDegs]
+
+# Import the data from the specified file and create points.
+path = os.path.join(os.getcwd(), fileName)
+points = panelGeometry.importPoints(path, seperator)
+
+# Compute the viscous and inviscid polars, sharing one factorized system
+system = panelMethods.SourceVortexSystem(points)
+solver = viscousPanelMethod.ViscousSourceVortexSolver(points, reynoldsNumber, system=system)
+viscous = solver.findPolar(alphas)
+inviscid = system.findCoefficients(1, alphas)
+
+# Plot the cls vs alpha
+plt.subplot(1, 2, 1)
+plt.plot(alphaDegs, [result[1] for result in inviscid], "--", c="k", label="Inviscid")
+plt.plot(alphaDegs, [result[1] for result in viscous], "o-", label="Viscous")
+plt.xlabel(r"$\alpha$")
+plt.ylabel("$c_l$")
+plt.legend(loc="upper left")
+
+# Plot the drag polar
+plt.subplot(1, 2, 2)
+plt.plot([result[2] for result in viscous], [result[1] for result in viscous], "o-")
+plt.xlabel("$c_d$")
+plt.ylabel("$c_l$")
+
+plt.suptitle(str.format("{}, Re = {:.1e}", os.path.splitext(fileName)[0], reynoldsNumber))
+plt.show()